@@ -16,8 +16,7 @@ aws_account_module = AWSAccountModule()
 async def create_aws_account(account: AWSAccountCreate):
     """AWS 계정 등록"""
     try:
-        created_account = await aws_account_module.create_account(account)
-        return AWSAccountResponse(**created_account.dict())
+        return await aws_account_module.create_account(account)
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -39,8 +38,7 @@ async def create_aws_account(account: AWSAccountCreate):
 async def get_all_aws_accounts():
     """등록된 AWS 계정 목록 조회"""
     try:
-        accounts = await aws_account_module.get_all_accounts()
-        return [AWSAccountResponse(**account.dict()) for account in accounts]
+        return await aws_account_module.get_all_accounts()
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -62,7 +60,7 @@ async def update_aws_account(account_id: str, account_update: AWSAccountUpdate):
                 "message": f"계정을 찾을 수 없습니다: {account_id}"
             }
         )
-    return AWSAccountResponse(**updated_account.dict())
+    return updated_account
 
 @router.delete("/{account_id}")
 async def delete_aws_account(account_id: str):
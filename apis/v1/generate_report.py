@@ -2,11 +2,6 @@
 from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from report_tools.generators.generate_monthly_report import (
-    generate_monthly_report,
-    get_previous_month,
-    get_month_date_range
-)
 import logging
 
 router = APIRouter(prefix="/reports", tags=["reports"])
@@ -43,6 +38,13 @@ class GenerateReportResponse(BaseModel):
              description="지정된 년월의 RDS 인스턴스 월간 리포트를 생성합니다. "
                          "년월을 지정하지 않으면 전월 기준으로 생성됩니다.")
 async def generate_report(request: GenerateReportRequest):
+    # 리포트 생성기(시각화 라이브러리 포함)는 첫 요청 시점에 로드하여 서버 기동 시간 단축
+    from report_tools.generators.generate_monthly_report import (
+        generate_monthly_report,
+        get_previous_month,
+        get_month_date_range
+    )
+
     try:
         # 년월 미지정시 전월 기준
         year = request.year
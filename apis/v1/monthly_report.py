@@ -1,20 +1,47 @@
 # apis/v1/monthly_report.py
 
-from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Query
-from collectors.cloudwatch_metric_collector import RDSCloudWatchCollector
-from modules.aws_session_manager import AWSSessionManager
+import asyncio
 import logging
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, Query
+from modules.collection_pools import EnvType, get_process_pool, replace_broken_process_pool
 
 router = APIRouter(prefix="/reports/gather", tags=["reports"])
 logger = logging.getLogger(__name__)
 
 
+async def _collect_month(env: str, year: int, month: int) -> Dict[str, Any]:
+    """월간 메트릭 수집 후 이번 이벤트 루프에 묶인 MongoDB 클라이언트 정리"""
+    # 수집기 모듈은 워커 프로세스에서만 로드 (API 프로세스 기동 시 임포트하지 않음)
+    from collectors.cloudwatch_metric_collector import run_monthly_collection
+    from configs.mongo_conf import close_mongo_client
+    from modules.mongodb_connector import MongoDBConnector
+
+    try:
+        return await run_monthly_collection(year, month, env)
+    finally:
+        # 워커 프로세스는 다음 요청에서 새 이벤트 루프로 재사용되므로
+        # 종료된 루프에 묶인 클라이언트가 남지 않도록 매 요청 후 닫음
+        await MongoDBConnector.close()
+        close_mongo_client()
+
+
+def _collect_month_entrypoint(env: str, year: int, month: int) -> Dict[str, Any]:
+    """워커 프로세스 진입점: 독립된 이벤트 루프에서 월간 메트릭 수집"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    return asyncio.run(_collect_month(env, year, month))
+
+
 @router.get("/cw_metrics")
 async def collect_monthly_metrics(
         year: int = Query(..., description="수집 연도"),
         month: int = Query(..., ge=1, le=12, description="수집 월 (1-12)"),
-        env: str = Query('prd', description="환경 ('prd' 또는 'dev')")
+        env: EnvType = Query('prd', description="환경 ('prd' 또는 'dev')")
 ):
     """월간 RDS CloudWatch 메트릭 수집 API
 
@@ -24,28 +51,20 @@ async def collect_monthly_metrics(
         env: 환경 구분 ('prd' 또는 'dev')
     """
     try:
-        # AWS 세션 매니저 초기화
-        session_manager = AWSSessionManager()
-
-        # 해당 월의 마지막 날짜 계산
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
-
-        await session_manager.initialize(
-            env=env,
-            end_date=end_date.strftime("%Y-%m-%d")
-        )
-
-        # CloudWatch 메트릭 수집기 초기화
-        collector = RDSCloudWatchCollector(session_manager)
-
-        # 메트릭 수집 및 저장
-        metrics = await collector.collect_metrics_monthly(
-            year=year,
-            month=month
-        )
+        # 장시간 수집 작업은 별도 프로세스에서 실행하여 API 이벤트 루프를 점유하지 않음
+        loop = asyncio.get_running_loop()
+        try:
+            metrics = await loop.run_in_executor(
+                get_process_pool(env),
+                _collect_month_entrypoint,
+                env,
+                year,
+                month
+            )
+        except BrokenProcessPool:
+            # 워커가 비정상 종료된 풀은 이후 모든 요청이 실패하므로 새 풀로 교체
+            replace_broken_process_pool(env)
+            raise
 
         return {
             "status": "success",
@@ -61,4 +80,4 @@ async def collect_monthly_metrics(
                 "status": "error",
                 "message": f"메트릭 수집 중 오류가 발생했습니다: {str(e)}"
             }
-        )
\ No newline at end of file
+        )
@@ -2,24 +2,67 @@
 
 import logging
 import asyncio
-import pytz
+import heapq
+import numpy as np
+from collections import defaultdict
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Any, Optional
+from time import monotonic_ns
+from zoneinfo import ZoneInfo
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple
 from botocore.exceptions import ClientError
+from pymongo import UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError
 
 from modules.aws_session_manager import AWSSessionManager
 from modules.mongodb_connector import MongoDBConnector
 from configs.cloudwatch_conf import CloudWatchSettings
 from configs.mongo_conf import mongo_settings
 
+try:
+    from numba import njit
+
+    def tjit(func):
+        """Numba 설치 시 JIT 컴파일"""
+        return njit(cache=True, fastmath=True)(func)
+except ImportError:  # Numba는 선택 의존성
+    def tjit(func):
+        """Numba 미설치 시 원본 함수 사용"""
+        return func
+
 logger = logging.getLogger(__name__)
-kst = pytz.timezone('Asia/Seoul')
+kst = ZoneInfo('Asia/Seoul')
+UTC = ZoneInfo('UTC')
+
+
+@tjit
+def _reduce_metric(
+        max_values: np.ndarray,
+        min_values: np.ndarray,
+        avg_values: np.ndarray
+) -> Tuple[float, int, float, int, float]:
+    """
+    메트릭 값 배열의 최대/최소/평균 계산
+
+    Returns:
+        Tuple[float, int, float, int, float]: (최대값, 최대값 위치, 최소값, 최소값 위치, 평균)
+    """
+    max_index = max_values.argmax()
+    min_index = min_values.argmin()
+    return (
+        max_values[max_index], max_index,
+        min_values[min_index], min_index,
+        avg_values.mean()
+    )
 
-MAX_CONCURRENT_TASKS = 20
 
 class RDSCloudWatchCollector:
     """RDS CloudWatch 메트릭 수집기"""
 
+    MAX_CONCURRENT_TASKS = 20  # 전체 계정 기준 인스턴스 동시 처리 수
+    MAX_METRIC_DATA_QUERIES = 500  # GetMetricData 요청당 최대 쿼리 수
+    METRIC_STATISTICS = ('Average', 'Maximum', 'Minimum')
+    LIST_METRICS_WINDOW = timedelta(days=14)  # ListMetrics가 반환하는 메트릭의 최근 활동 기간
+
     def __init__(self, session_manager: AWSSessionManager):
         """
         Args:
@@ -27,9 +70,19 @@ class RDSCloudWatchCollector:
         """
         self.session_manager = session_manager
         self.settings = CloudWatchSettings()
+        # 인스턴스 유형별 수집 메트릭 목록 (수집 중 변하지 않으므로 한 번만 생성)
+        self._aurora_metrics = self.settings.METRICS
+        self._common_metrics = tuple(self.settings.COMMON_METRICS)
         self._instance_info = self.session_manager.get_instance_info()
-        self._metric_cache = {}
+        self._metric_cache = {}  # key -> (만료 시각(monotonic ns), 데이터)
+        self._cache_expiry_heap = []  # (만료 시각, key) 최소 힙
         self._cache_ttl = 3600  # 캐시 유효시간 (1시간)
+        self._cache_ttl_ns = self._cache_ttl * 1_000_000_000
+        self._cw_clients: Dict[Tuple[str, str], Any] = {}  # (계정 ID, 리전) -> CloudWatch 클라이언트
+        # (계정 ID, 리전, 인스턴스 ID) -> ListMetrics 결과
+        self._available_metrics: Dict[Tuple[str, str, str], Set[str]] = {}
+        # 전체 계정에 걸친 인스턴스 동시 처리 수 제한 (CloudWatch API TPS 보호)
+        self._limiter = asyncio.Semaphore(self.MAX_CONCURRENT_TASKS)
 
     @property
     def collection_name(self) -> str:
@@ -62,20 +115,35 @@ class RDSCloudWatchCollector:
             else:
                 end_date = datetime(year, month + 1, 1) - timedelta(days=1)
 
+            # 월간 일자 구간은 한 번만 계산하여 전체 계정이 공유
+            day_buckets = self._build_day_buckets(start_date, end_date)
+
             logger.info(
                 f"{year}년 {month}월 메트릭 수집 시작: "
                 f"{len(self._instance_info.accounts)}개 계정, "
                 f"{self._instance_info.total_instances}개 인스턴스"
             )
 
-            # 계정별로 메트릭 수집
-            account_metrics = {}
-            for account in self._instance_info.accounts:
-                metrics = await self._collect_monthly_metrics(
+            # 계정별 병렬 메트릭 수집
+            tasks = [
+                self._collect_monthly_metrics(
                     account=account,
-                    start_date=start_date,
-                    end_date=end_date
+                    day_buckets=day_buckets
                 )
+                for account in self._instance_info.accounts
+            ]
+
+            account_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            account_metrics = {}
+            for account, metrics in zip(self._instance_info.accounts, account_results):
+                if isinstance(metrics, Exception):
+                    logger.error(
+                        f"계정 {account.account_id} "
+                        f"처리 실패: {metrics}"
+                    )
+                    continue
+
                 if metrics:  # 수집된 메트릭이 있는 경우만 저장
                     account_metrics[account.account_id] = metrics
 
@@ -96,23 +164,37 @@ class RDSCloudWatchCollector:
             logger.error(f"월간 메트릭 수집 중 오류 발생: {e}")
             raise
 
-    MAX_CONCURRENT_TASKS = 20  # 클래스 변수로 추가
+    @staticmethod
+    def _build_day_buckets(start_date: datetime, end_date: datetime) -> Dict[datetime, str]:
+        """
+        수집 기간의 일자별 구간 생성
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
 
-    # collectors/cloudwatch_metric_collector.py의 _collect_monthly_metrics 메서드 수정
+        Returns:
+            Dict[datetime, str]: KST 기준 일자 시작 시각(UTC) -> 날짜 문자열 ('%Y-%m-%d')
+        """
+        day_buckets = {}
+        current_date = start_date.date()
+        while current_date <= end_date.date():
+            day_start_utc = datetime.combine(current_date, time.min, tzinfo=kst).astimezone(UTC)
+            day_buckets[day_start_utc] = current_date.strftime('%Y-%m-%d')
+            current_date += timedelta(days=1)
+        return day_buckets
 
     async def _collect_monthly_metrics(
             self,
             account: Any,
-            start_date: datetime,
-            end_date: datetime
+            day_buckets: Dict[datetime, str]
     ) -> Dict[str, Dict]:
         """
         계정의 월간 메트릭 수집
 
         Args:
             account: 계정 정보
-            start_date: 시작 날짜
-            end_date: 종료 날짜
+            day_buckets: 일자별 구간 (KST 일자 시작 시각(UTC) -> 날짜 문자열)
 
         Returns:
             Dict[str, Dict]: 인스턴스별 일일 메트릭
@@ -124,47 +206,42 @@ class RDSCloudWatchCollector:
                 f"[{', '.join(inst.instance_identifier for inst in account.instances)}]"  # 인스턴스 목록 추가
             )
 
-            monthly_metrics = {}
-            current_date = start_date
-
-            while current_date <= end_date:
-                date_str = current_date.strftime('%Y-%m-%d')
-                logger.info(f"\n[{account.account_id}] {date_str} 메트릭 수집 시작")
-
-                # 인스턴스별 병렬 처리
-                tasks = [
-                    self._collect_instance_metrics(
+            async def collect(instance: Any) -> Tuple[Any, Any]:
+                """인스턴스와 수집 결과(또는 예외)를 함께 반환"""
+                try:
+                    return instance, await self._collect_instance_metrics(
                         account_id=account.account_id,
                         instance=instance,
-                        date=current_date
+                        day_buckets=day_buckets
                     )
-                    for instance in account.instances
-                ]
-
-                instance_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # 결과 처리
-                successful_instances = []  # 성공한 인스턴스 목록
-                for instance, metrics in zip(account.instances, instance_results):
-                    if isinstance(metrics, Exception):
-                        logger.error(
-                            f"인스턴스 {instance.instance_identifier} "
-                            f"처리 실패: {metrics}"
-                        )
-                        continue
-
-                    if metrics:
-                        if instance.instance_identifier not in monthly_metrics:
-                            monthly_metrics[instance.instance_identifier] = {}
-                        monthly_metrics[instance.instance_identifier][date_str] = metrics
-                        successful_instances.append(instance.instance_identifier)
-
-                current_date += timedelta(days=1)
-                logger.info(
-                    f"[{account.account_id}] {date_str} 메트릭 수집 완료 "
-                    f"({len(successful_instances)}/{len(account.instances)} 인스턴스): "
-                    f"[{', '.join(sorted(successful_instances))}]"  # 성공한 인스턴스 목록
-                )
+                except Exception as e:
+                    return instance, e
+
+            # 인스턴스별 병렬 처리 (인스턴스당 한 달 치를 한 번에 조회)
+            tasks = [collect(instance) for instance in account.instances]
+
+            # 완료되는 순서대로 결과 처리
+            monthly_metrics = {}
+            successful_instances = []  # 성공한 인스턴스 목록
+            for next_result in asyncio.as_completed(tasks):
+                instance, daily_metrics = await next_result
+                if isinstance(daily_metrics, Exception):
+                    logger.error(
+                        f"인스턴스 {instance.instance_identifier} "
+                        f"처리 실패: {daily_metrics}"
+                    )
+                    continue
+
+                if daily_metrics:
+                    monthly_metrics[instance.instance_identifier] = daily_metrics
+                    successful_instances.append(instance.instance_identifier)
+
+            logger.info(
+                f"[{account.account_id}] "
+                f"{min(day_buckets.values())} ~ {max(day_buckets.values())} 메트릭 수집 완료 "
+                f"({len(successful_instances)}/{len(account.instances)} 인스턴스): "
+                f"[{', '.join(sorted(successful_instances))}]"  # 성공한 인스턴스 목록
+            )
 
             return monthly_metrics
 
@@ -175,223 +252,346 @@ class RDSCloudWatchCollector:
             )
             raise
 
-    def _chunk_instances(self, instances: List[Any], chunk_size: int) -> List[List[Any]]:
-        """인스턴스 리스트를 청크로 분할"""
-        return [instances[i:i + chunk_size] for i in range(0, len(instances), chunk_size)]
+    async def _get_cw_client(self, account_id: str, region: str) -> Any:
+        """계정/리전별 CloudWatch 비동기 클라이언트 반환 (재사용)"""
+        key = (account_id, region)
+        client = self._cw_clients.get(key)
+        if client is None:
+            client = await self.session_manager.get_async_client('cloudwatch', account_id, region)
+            self._cw_clients[key] = client
+        return client
 
     async def _collect_instance_metrics(
             self,
             account_id: str,
             instance: Any,
-            date: datetime
-    ) -> Optional[Dict[str, Any]]:
+            day_buckets: Dict[datetime, str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
         """
         인스턴스별 메트릭 수집
 
         Args:
             account_id: AWS 계정 ID
             instance: 인스턴스 정보
-            date: 수집 대상 날짜
+            day_buckets: 일자별 구간 (KST 일자 시작 시각(UTC) -> 날짜 문자열)
 
         Returns:
-            Optional[Dict[str, Any]]: 수집된 메트릭 데이터
+            Optional[Dict[str, Dict[str, Any]]]: 날짜별, 메트릭별 수집 데이터
         """
-        try:
-            logger.debug(
-                f"인스턴스 {instance.instance_identifier} "
-                f"({instance.region}) 메트릭 수집 시작"
-            )
+        async with self._limiter:
+            try:
+                logger.debug(
+                    f"인스턴스 {instance.instance_identifier} "
+                    f"({instance.region}) 메트릭 수집 시작"
+                )
 
-            cloudwatch = self.session_manager.get_client(
-                'cloudwatch',
-                account_id,
-                instance.region
-            )
+                cloudwatch = await self._get_cw_client(account_id, instance.region)
 
-            # Aurora 여부 확인
-            is_aurora = await self._check_aurora_instance(
-                cloudwatch,
-                instance.instance_identifier,
-                date
-            )
+                # Aurora 여부 확인 (수집된 인스턴스 엔진 정보 기준)
+                is_aurora = instance.is_aurora
 
-            # 수집할 메트릭 결정
-            metrics_to_collect = (
-                self.settings.METRICS if is_aurora
-                else self.settings.COMMON_METRICS
-            )
+                # 수집할 메트릭 결정
+                metrics_to_collect = self._aurora_metrics if is_aurora else self._common_metrics
 
-            # 메트릭 병렬 수집
-            tasks = [
-                self._get_metric_data(
+                # ListMetrics는 최근 2주간 활동한 메트릭만 반환하므로
+                # 수집 기간이 해당 구간과 겹칠 때만 조회 (과거 월은 GetMetricData로 바로 조회)
+                overlaps_window, within_window = self._list_metrics_coverage(day_buckets)
+                if overlaps_window:
+                    available_metrics = await self._get_available_metrics(
+                        cloudwatch,
+                        account_id,
+                        instance.region,
+                        instance.instance_identifier
+                    )
+                    if available_metrics is not None:
+                        if not available_metrics:
+                            logger.info(
+                                f"- {instance.instance_identifier}: "
+                                f"최근 활동 메트릭이 없어 수집 생략"
+                            )
+                            return None
+
+                        # 수집 기간 전체가 구간 안에 있을 때만 개별 메트릭을 제외
+                        # (구간 밖 일자에만 데이터가 있는 메트릭이 누락되지 않도록 함)
+                        if within_window:
+                            metrics_to_collect = tuple(
+                                metric for metric in metrics_to_collect
+                                if metric in available_metrics
+                            )
+
+                # 전체 메트릭을 GetMetricData 배치로 조회
+                results = await self._get_metric_data_batch(
                     cloudwatch,
-                    metric,
                     instance.instance_identifier,
-                    date
+                    metrics_to_collect,
+                    day_buckets
                 )
-                for metric in metrics_to_collect
-            ]
 
-            results = await asyncio.gather(*tasks)
+                # 메트릭별 결과를 날짜별로 재구성
+                daily_metrics: Dict[str, Dict[str, Any]] = {}
+                for metric, date_stats in results.items():
+                    for date_str, stats in date_stats.items():
+                        daily_metrics.setdefault(date_str, {})[metric] = stats
+
+                if daily_metrics:
+                    logger.debug(
+                        f"✓ {instance.instance_identifier}: "
+                        f"{len(results)}/{len(metrics_to_collect)} "
+                        f"메트릭, {len(daily_metrics)}일 수집 완료"
+                    )
+                else:
+                    logger.warning(
+                        f"✗ {instance.instance_identifier}: "
+                        f"수집된 메트릭 없음"
+                    )
 
-            # 결과 처리
-            instance_metrics = {}
-            for metric, data in zip(metrics_to_collect, results):
-                if data:
-                    instance_metrics[metric] = data
+                return dict(sorted(daily_metrics.items())) if daily_metrics else None
 
-            if instance_metrics:
-                logger.debug(
-                    f"✓ {instance.instance_identifier}: "
-                    f"{len(instance_metrics)}/{len(metrics_to_collect)} "
-                    f"메트릭 수집 완료"
-                )
-            else:
-                logger.warning(
-                    f"✗ {instance.instance_identifier}: "
-                    f"수집된 메트릭 없음"
+            except Exception as e:
+                logger.error(
+                    f"인스턴스 {instance.instance_identifier} "
+                    f"메트릭 수집 실패: {e}"
                 )
+                raise
 
-            return instance_metrics if instance_metrics else None
+    @classmethod
+    def _list_metrics_coverage(cls, day_buckets: Dict[datetime, str]) -> Tuple[bool, bool]:
+        """
+        수집 기간과 ListMetrics 조회 가능 구간(최근 2주)의 관계
 
-        except Exception as e:
-            logger.error(
-                f"인스턴스 {instance.instance_identifier} "
-                f"메트릭 수집 실패: {e}"
-            )
-            raise
+        Args:
+            day_buckets: 일자별 구간 (KST 일자 시작 시각(UTC) -> 날짜 문자열)
 
-    async def _check_aurora_instance(
+        Returns:
+            Tuple[bool, bool]: (구간과 겹치는지 여부, 수집 기간 전체가 구간 안에 있는지 여부)
+        """
+        window_start = datetime.now(UTC) - cls.LIST_METRICS_WINDOW
+        start_time_utc = min(day_buckets)
+        end_time_utc = max(day_buckets) + timedelta(days=1)
+        return end_time_utc > window_start, start_time_utc >= window_start
+
+    async def _get_available_metrics(
             self,
             cloudwatch: Any,
-            instance_id: str,
-            date: datetime
-    ) -> bool:
+            account_id: str,
+            region: str,
+            instance_id: str
+    ) -> Optional[Set[str]]:
         """
-        Aurora 인스턴스 여부 확인
+        인스턴스에 대해 CloudWatch에 존재하는 메트릭 이름 조회 (ListMetrics)
 
         Args:
-            cloudwatch: CloudWatch 클라이언트
+            cloudwatch: CloudWatch 비동기 클라이언트
+            account_id: AWS 계정 ID
+            region: 리전
             instance_id: 인스턴스 식별자
-            date: 확인 대상 날짜
 
         Returns:
-            bool: Aurora 여부
+            Optional[Set[str]]: 메트릭 이름 집합, 조회 실패 시 None (필터링 생략)
         """
-        try:
-            test_metrics = ['ServerlessDatabaseCapacity', 'AuroraReplicaLag']
+        # 인스턴스 식별자는 계정/리전 간에 중복될 수 있으므로 함께 키로 사용
+        cache_key = (account_id, region, instance_id)
+        if cache_key in self._available_metrics:
+            return self._available_metrics[cache_key]
 
-            tasks = [
-                self._get_metric_data(
-                    cloudwatch,
-                    metric,
-                    instance_id,
-                    date,
-                    is_test=True
-                )
-                for metric in test_metrics
-            ]
-
-            results = await asyncio.gather(*tasks)
-
-            return any(result is not None for result in results)
+        try:
+            metric_names = set()
+            params = {
+                'Namespace': 'AWS/RDS',
+                'Dimensions': [{
+                    'Name': 'DBInstanceIdentifier',
+                    'Value': instance_id
+                }]
+            }
+
+            while True:
+                response = await cloudwatch.list_metrics(**params)
+                metric_names.update(metric['MetricName'] for metric in response['Metrics'])
+
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+                params['NextToken'] = next_token
 
         except Exception as e:
-            logger.error(
-                f"Aurora 여부 확인 중 오류 발생 "
+            logger.warning(
+                f"메트릭 목록 조회 실패, 전체 메트릭 조회로 진행 "
                 f"(인스턴스: {instance_id}): {e}"
             )
-            return False
+            return None
 
-    async def _get_metric_data(
+        self._available_metrics[cache_key] = metric_names
+        return metric_names
+
+    async def _get_metric_data_batch(
             self,
             cloudwatch: Any,
-            metric_name: str,
             instance_id: str,
-            date: datetime,
+            metric_names: Sequence[str],
+            day_buckets: Dict[datetime, str],
             is_test: bool = False
-    ) -> Optional[Dict[str, Any]]:
-        """CloudWatch 메트릭 데이터 조회 (캐시 적용)"""
-        try:
-            # 캐시 키 생성
-            cache_key = f"{instance_id}:{metric_name}:{date.strftime('%Y-%m-%d')}"
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        CloudWatch GetMetricData 배치 조회 (캐시 적용)
+
+        메트릭당 Average/Maximum/Minimum 3개 쿼리를 구성하여
+        최대 500개 쿼리 단위로 한 번에 조회합니다.
 
-            # 캐시 확인
-            cached_data = self._metric_cache.get(cache_key)
+        Args:
+            cloudwatch: CloudWatch 비동기 클라이언트
+            instance_id: 인스턴스 식별자
+            metric_names: 조회할 메트릭 목록
+            day_buckets: 일자별 구간 (KST 일자 시작 시각(UTC) -> 날짜 문자열)
+            is_test: 테스트 조회 여부 (오류 로깅 생략)
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: 메트릭별, 날짜별 통계값
+        """
+        # 조회 구간: 첫 일자 00:00 ~ 마지막 일자 다음날 00:00 (KST)
+        day_starts = list(day_buckets)
+        start_time_utc = day_starts[0]
+        end_time_utc = day_starts[-1] + timedelta(days=1)
+        period_key = f"{day_buckets[start_time_utc]}:{day_buckets[day_starts[-1]]}"
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        # 캐시 확인
+        pending_metrics = []
+        now = monotonic_ns()
+        for metric_name in metric_names:
+            cached_data = self._metric_cache.get(f"{instance_id}:{metric_name}:{period_key}")
             if cached_data:
-                cache_time, data = cached_data
-                if (datetime.now() - cache_time).total_seconds() < self._cache_ttl:
-                    return data
-
-            # KST -> UTC 변환
-            start_time_kst = datetime.combine(date.date(), time.min).replace(tzinfo=kst)
-            end_time_kst = datetime.combine(date.date(), time.max).replace(tzinfo=kst)
-
-            start_time_utc = start_time_kst.astimezone(pytz.UTC)
-            end_time_utc = end_time_kst.astimezone(pytz.UTC)
-
-            dimensions = [{
-                'Name': 'DBInstanceIdentifier',
-                'Value': instance_id
-            }]
-
-            response = await asyncio.to_thread(
-                cloudwatch.get_metric_statistics,
-                Namespace='AWS/RDS',
-                MetricName=metric_name,
-                Dimensions=dimensions,
-                StartTime=start_time_utc,
-                EndTime=end_time_utc,
-                Period=86400,
-                Statistics=['Average', 'Maximum', 'Minimum']
-            )
+                expires_at, data = cached_data
+                if expires_at > now:
+                    results[metric_name] = data
+                    continue
+            pending_metrics.append(metric_name)
+
+        if not pending_metrics:
+            return results
+
+        dimensions = ({
+            'Name': 'DBInstanceIdentifier',
+            'Value': instance_id
+        },)
+
+        # 메트릭 x 통계 조합으로 쿼리 구성
+        queries = []
+        query_map = {}
+        for metric_name in pending_metrics:
+            for stat in self.METRIC_STATISTICS:
+                query_id = f"m{len(queries)}"
+                query_map[query_id] = (metric_name, stat)
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/RDS',
+                            'MetricName': metric_name,
+                            'Dimensions': dimensions
+                        },
+                        'Period': 86400,
+                        'Stat': stat
+                    },
+                    'ReturnData': True
+                })
 
-            if not response['Datapoints']:
-                if not is_test and metric_name in ['CPUUtilization', 'DatabaseConnections']:
-                    logger.warning(
-                        f"핵심 메트릭 {metric_name}에 대한 "
-                        f"데이터가 없습니다 (인스턴스: {instance_id})"
-                    )
-                return None
+        # 메트릭별, 타임스탬프별 데이터 포인트 (GetMetricStatistics Datapoints 형태)
+        datapoints: Dict[str, Dict[datetime, Dict[str, Any]]] = {}
 
-            # 통계 계산
-            result = self._calculate_statistics(response['Datapoints'])
+        try:
+            for i in range(0, len(queries), self.MAX_METRIC_DATA_QUERIES):
+                chunk = queries[i:i + self.MAX_METRIC_DATA_QUERIES]
+                next_token = None
+
+                while True:
+                    params = {
+                        'MetricDataQueries': chunk,
+                        'StartTime': start_time_utc,
+                        'EndTime': end_time_utc,
+                        'ScanBy': 'TimestampAscending'
+                    }
+                    if next_token:
+                        params['NextToken'] = next_token
 
-            # 결과 캐싱
-            if result:
-                self._metric_cache[cache_key] = (datetime.now(), result)
+                    response = await cloudwatch.get_metric_data(**params)
 
-            return result
+                    for result in response['MetricDataResults']:
+                        metric_name, stat = query_map[result['Id']]
+                        metric_points = datapoints.setdefault(metric_name, {})
+                        for timestamp, value in zip(result['Timestamps'], result['Values']):
+                            point = metric_points.setdefault(timestamp, {'Timestamp': timestamp})
+                            point[stat] = value
+
+                    next_token = response.get('NextToken')
+                    if not next_token:
+                        break
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if not is_test and error_code != 'InvalidParameterCombination':
                 logger.error(
                     f"CloudWatch API 오류 "
-                    f"(메트릭: {metric_name}, 인스턴스: {instance_id}): {e}"
+                    f"(인스턴스: {instance_id}): {e}"
                 )
-            return None
+            return results
         except Exception as e:
             if not is_test:
                 logger.error(
                     f"예상치 못한 오류 "
-                    f"(메트릭: {metric_name}, 인스턴스: {instance_id}): {e}"
+                    f"(인스턴스: {instance_id}): {e}"
                 )
-            return None
+            return results
+
+        for metric_name in pending_metrics:
+            # KST 날짜별로 데이터 포인트 분류
+            daily_points: Dict[str, List[Dict]] = {}
+            for point in datapoints.get(metric_name, {}).values():
+                if all(stat in point for stat in self.METRIC_STATISTICS):
+                    date_str = day_buckets.get(point['Timestamp'])
+                    if date_str is None:
+                        date_str = point['Timestamp'].astimezone(kst).strftime('%Y-%m-%d')
+                    daily_points.setdefault(date_str, []).append(point)
+
+            if not daily_points:
+                if not is_test and metric_name in ['CPUUtilization', 'DatabaseConnections']:
+                    logger.warning(
+                        f"핵심 메트릭 {metric_name}에 대한 "
+                        f"데이터가 없습니다 (인스턴스: {instance_id})"
+                    )
+                continue
+
+            # 통계 계산
+            metric_result = {
+                date_str: self._calculate_statistics(points)
+                for date_str, points in sorted(daily_points.items())
+            }
+
+            # 결과 캐싱
+            self._set_cache(f"{instance_id}:{metric_name}:{period_key}", metric_result)
+            results[metric_name] = metric_result
+
+        return results
+
+    def _set_cache(self, key: str, data: Any) -> None:
+        """캐시 저장 (만료 시각을 함께 기록)"""
+        expires_at = monotonic_ns() + self._cache_ttl_ns
+        self._metric_cache[key] = (expires_at, data)
+        heapq.heappush(self._cache_expiry_heap, (expires_at, key))
 
     def clear_cache(self):
         """캐시 초기화"""
         self._metric_cache.clear()
+        self._cache_expiry_heap.clear()
 
     def remove_expired_cache(self):
         """만료된 캐시 제거"""
-        now = datetime.now()
-        expired_keys = [
-            key for key, (cache_time, _) in self._metric_cache.items()
-            if (now - cache_time).total_seconds() >= self._cache_ttl
-        ]
-        for key in expired_keys:
-            del self._metric_cache[key]
+        now = monotonic_ns()
+        while self._cache_expiry_heap and self._cache_expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._cache_expiry_heap)
+            cached_data = self._metric_cache.get(key)
+            # 재저장된 항목은 새 만료 시각을 가지므로 유지
+            if cached_data and cached_data[0] == expires_at:
+                del self._metric_cache[key]
 
     def _calculate_statistics(
             self,
@@ -409,21 +609,23 @@ class RDSCloudWatchCollector:
         if not datapoints:
             return None
 
-        max_value = max(point['Maximum'] for point in datapoints)
-        min_value = min(point['Minimum'] for point in datapoints)
-        avg_value = sum(point['Average'] for point in datapoints) / len(datapoints)
+        count = len(datapoints)
+        max_values = np.fromiter((point['Maximum'] for point in datapoints), dtype=np.float64, count=count)
+        min_values = np.fromiter((point['Minimum'] for point in datapoints), dtype=np.float64, count=count)
+        avg_values = np.fromiter((point['Average'] for point in datapoints), dtype=np.float64, count=count)
 
-        max_point = max(datapoints, key=lambda x: x['Maximum'])
-        min_point = min(datapoints, key=lambda x: x['Minimum'])
+        max_value, max_index, min_value, min_index, avg_value = _reduce_metric(
+            max_values, min_values, avg_values
+        )
 
         return {
             'max': {
                 'value': float(max_value),
-                'timestamp': max_point['Timestamp'].astimezone(kst).isoformat()
+                'timestamp': datapoints[max_index]['Timestamp'].astimezone(kst).isoformat()
             },
             'min': {
                 'value': float(min_value),
-                'timestamp': min_point['Timestamp'].astimezone(kst).isoformat()
+                'timestamp': datapoints[min_index]['Timestamp'].astimezone(kst).isoformat()
             },
             'avg': float(avg_value)
         }
@@ -444,21 +646,18 @@ class RDSCloudWatchCollector:
         """
         try:
             db = await MongoDBConnector.get_database()
-            collection = db[self.collection_name]
+            # 재수집으로 복구 가능한 데이터이므로 저널 동기화 대기 생략
+            collection = db.get_collection(
+                self.collection_name,
+                write_concern=WriteConcern(w=1, j=False)
+            )
 
-            # 인스턴스별로 저장
+            # 인스턴스별 upsert 작업 구성
+            operations = []
+            instance_ids = []
+            created_at = datetime.now(kst).isoformat()
             for account_id, metrics in account_metrics.items():
                 for instance_id, daily_metrics in metrics.items():
-                    # 일별 메트릭 데이터 구조화
-                    structured_daily_metrics = {}
-                    for date, date_metrics in daily_metrics.items():
-                        # 메트릭별 데이터 정리
-                        metric_values = {}
-                        for metric_name, metric_data in date_metrics.items():
-                            metric_values[metric_name] = metric_data
-
-                        structured_daily_metrics[date] = metric_values
-
                     # 월간 요약 통계
                     monthly_summary = self._calculate_monthly_summary(daily_metrics)
 
@@ -469,9 +668,9 @@ class RDSCloudWatchCollector:
                         "month": month,
                         "account_id": account_id,
                         "instance_id": instance_id,
-                        "daily_metrics": structured_daily_metrics,
+                        "daily_metrics": daily_metrics,
                         "monthly_summary": monthly_summary,
-                        "created_at": datetime.now(kst).isoformat()
+                        "created_at": created_at
                     }
 
                     # 인스턴스별 도큐먼트 upsert
@@ -483,30 +682,34 @@ class RDSCloudWatchCollector:
                         "instance_id": instance_id
                     }
 
-                    try:
-                        result = await collection.update_one(
-                            filter_doc,
-                            {"$set": document},
-                            upsert=True
-                        )
-
-                        operation = "업데이트" if result.modified_count else "생성"
-                        logger.info(
-                            f"인스턴스 {instance_id}의 "
-                            f"{year}년 {month}월 메트릭 도큐먼트 {operation} 완료"
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"인스턴스 {instance_id} 메트릭 저장 실패: {str(e)}"
-                        )
-                        continue
-
-                logger.info(
-                    f"계정 {account_id}의 "
-                    f"{year}년 {month}월 전체 메트릭 저장 완료 "
-                    f"({len(metrics)}개 인스턴스)"
+                    operations.append(UpdateOne(filter_doc, {"$set": document}, upsert=True))
+                    instance_ids.append(instance_id)
+
+            if not operations:
+                return
+
+            # 전체 도큐먼트를 한 번의 요청으로 저장 (개별 실패는 나머지 저장에 영향 없음)
+            try:
+                result = await collection.bulk_write(
+                    operations,
+                    ordered=False,
+                    bypass_document_validation=True
                 )
+                bulk_result = result.bulk_api_result
+            except BulkWriteError as e:
+                bulk_result = e.details
+                for error in bulk_result.get('writeErrors', []):
+                    logger.error(
+                        f"인스턴스 {instance_ids[error['index']]} "
+                        f"메트릭 저장 실패: {error.get('errmsg')}"
+                    )
+
+            logger.info(
+                f"{year}년 {month}월 메트릭 도큐먼트 저장 완료 "
+                f"(생성: {bulk_result.get('nUpserted', 0)}, "
+                f"업데이트: {bulk_result.get('nModified', 0)}, "
+                f"전체: {len(operations)}개 인스턴스)"
+            )
 
         except Exception as e:
             logger.error(f"MongoDB 저장 중 오류 발생: {e}")
@@ -522,51 +725,69 @@ class RDSCloudWatchCollector:
         Returns:
             Dict: 월간 요약 통계
         """
+        # 메트릭별 일자 데이터를 한 번의 순회로 분류
+        per_metric = defaultdict(list)
+        for date_metrics in daily_metrics.values():
+            for metric_name, daily_metric in date_metrics.items():
+                per_metric[metric_name].append(daily_metric)
+
         monthly_summary = {}
+        for metric_name, day_values in per_metric.items():
+            count = len(day_values)
+            max_values = np.fromiter((m['max']['value'] for m in day_values), dtype=np.float64, count=count)
+            min_values = np.fromiter((m['min']['value'] for m in day_values), dtype=np.float64, count=count)
+            avg_values = np.fromiter((m['avg'] for m in day_values), dtype=np.float64, count=count)
+
+            max_value, max_index, min_value, min_index, avg_value = _reduce_metric(
+                max_values, min_values, avg_values
+            )
 
-        # 각 메트릭 유형별로 처리
-        metric_types = set()
-        for day_metrics in daily_metrics.values():
-            metric_types.update(day_metrics.keys())
-
-        for metric_name in metric_types:
-            metric_values = []
-            max_value = float('-inf')
-            min_value = float('inf')
-            max_timestamp = None
-            min_timestamp = None
-
-            # 각 일자별 메트릭 처리
-            for date_metrics in daily_metrics.values():
-                if metric_name in date_metrics:
-                    daily_metric = date_metrics[metric_name]
-
-                    # 최대값 업데이트
-                    if daily_metric['max']['value'] > max_value:
-                        max_value = daily_metric['max']['value']
-                        max_timestamp = daily_metric['max']['timestamp']
-
-                    # 최소값 업데이트
-                    if daily_metric['min']['value'] < min_value:
-                        min_value = daily_metric['min']['value']
-                        min_timestamp = daily_metric['min']['timestamp']
-
-                    # 평균값 계산을 위해 저장
-                    metric_values.append(daily_metric['avg'])
-
-            # 데이터가 있는 경우만 처리
-            if metric_values:
-                monthly_summary[metric_name] = {
-                    'max': {
-                        'value': float(max_value),
-                        'timestamp': max_timestamp
-                    },
-                    'min': {
-                        'value': float(min_value),
-                        'timestamp': min_timestamp
-                    },
-                    'avg': float(sum(metric_values) / len(metric_values)),
-                    'days_collected': len(metric_values)
-                }
+            monthly_summary[metric_name] = {
+                'max': {
+                    'value': float(max_value),
+                    'timestamp': day_values[max_index]['max']['timestamp']
+                },
+                'min': {
+                    'value': float(min_value),
+                    'timestamp': day_values[min_index]['min']['timestamp']
+                },
+                'avg': float(avg_value),
+                'days_collected': count
+            }
 
         return monthly_summary
+
+
+async def run_monthly_collection(year: int, month: int, env: str) -> Dict[str, Any]:
+    """
+    세션 초기화부터 월간 메트릭 수집/저장까지 수행
+
+    Args:
+        year: 수집 연도
+        month: 수집 월
+        env: 환경 구분 ('prd' 또는 'dev')
+
+    Returns:
+        Dict[str, Any]: 계정별, 인스턴스별 수집된 메트릭 데이터
+    """
+    # AWS 세션 매니저 초기화
+    session_manager = AWSSessionManager()
+
+    try:
+        # 해당 월의 마지막 날짜 계산
+        end_date = datetime(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+
+        await session_manager.initialize(
+            env=env,
+            end_date=end_date.strftime("%Y-%m-%d")
+        )
+
+        # CloudWatch 메트릭 수집기 초기화 후 수집 및 저장
+        collector = RDSCloudWatchCollector(session_manager)
+        return await collector.collect_metrics_monthly(
+            year=year,
+            month=month
+        )
+
+    finally:
+        await session_manager.close_async_clients()
@@ -1,33 +1,348 @@
 # collectors/cloudwatch_slowquery_collector.py
 
+import asyncio
+import functools
 import logging
+import queue
 import re
 import os
 import sys
-import pytz
+import threading
+import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
+from zoneinfo import ZoneInfo
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 from modules.aws_session_manager import AWSSessionManager
+from modules.collection_pools import get_analysis_pool, shutdown_analysis_pool
 from modules.mongodb_connector import MongoDBConnector
 from configs.mongo_conf import mongo_settings
 from configs.report_settings import ReportSettings
 
+try:
+    import re2  # google-re2 (선택 의존성)
+except ImportError:
+    re2 = None
+
+try:
+    from numba import njit  # Numba (선택 의존성)
+except ImportError:
+    njit = None
+
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+# stdout 출력은 QueueListener 스레드에서 처리하여 이벤트 루프가 로그 쓰기에 막히지 않도록 함
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_log_listener = QueueListener(_log_queue, _stdout_handler)
+# 리스너가 실행되는 동안에만 루트 로거에 연결 (collect_slow_queries 참고)
+_log_queue_handler = QueueHandler(_log_queue)
+_log_listener_lock = threading.Lock()
 logger = logging.getLogger(__name__)
-kst = pytz.timezone('Asia/Seoul')
+kst = ZoneInfo('Asia/Seoul')
+
+# 쿼리 정규화 패턴 (문자열 리터럴 | 숫자 리터럴)
+_NORM_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"|\b\d+\b")
+_WS_PATTERN = re.compile(r'\s+')
+
+
+def _normalize_ascii(buf: np.ndarray, out: np.ndarray) -> int:
+    """
+    ASCII 쿼리 바이트 배열을 한 번에 스캔하여 정규화 (_NORM_PATTERN/_WS_PATTERN과 동일한 규칙)
+    - 문자열 리터럴('...', "...")과 단어 경계로 둘러싸인 숫자는 '?'로 치환
+    - 연속된 공백은 하나로 축약하고 앞뒤 공백은 제거
+
+    Returns:
+        int: out에 기록된 바이트 수
+    """
+    n = buf.shape[0]
+    i = 0
+    j = 0
+    pending_space = False
+
+    while i < n:
+        c = buf[i]
+        if c == 32 or 9 <= c <= 13 or 28 <= c <= 31:
+            pending_space = j > 0
+            i += 1
+            continue
+
+        token_end = -1
+        if c == 39 or c == 34:
+            # 같은 따옴표가 닫히는 위치까지 리터럴로 취급
+            k = i + 1
+            while k < n and buf[k] != c:
+                k += 1
+            if k < n:
+                token_end = k + 1
+        elif 48 <= c <= 57:
+            # 앞 문자가 단어 문자가 아닌 경우에만 숫자 리터럴 후보
+            prev = buf[i - 1] if i > 0 else 32
+            if not (48 <= prev <= 57 or 65 <= prev <= 90 or 97 <= prev <= 122 or prev == 95):
+                k = i + 1
+                while k < n and 48 <= buf[k] <= 57:
+                    k += 1
+                nxt = buf[k] if k < n else 32
+                if not (65 <= nxt <= 90 or 97 <= nxt <= 122 or nxt == 95):
+                    token_end = k
+
+        if pending_space:
+            out[j] = 32
+            j += 1
+            pending_space = False
+
+        if token_end >= 0:
+            out[j] = 63
+            j += 1
+            i = token_end
+        else:
+            out[j] = c
+            j += 1
+            i += 1
+
+    return j
+
+
+if njit is not None:
+    _normalize_ascii_jit = njit(cache=True)(_normalize_ascii)
+else:
+    _normalize_ascii_jit = None
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_query_cached(query: str) -> str:
+    """쿼리 정규화 (동일한 쿼리 텍스트는 캐시된 결과 재사용)"""
+    # Numba 사용 가능하고 ASCII 쿼리인 경우 단일 패스 스캔 사용
+    if _normalize_ascii_jit is not None and query.isascii():
+        buf = np.frombuffer(query.encode('ascii'), dtype=np.uint8)
+        out = np.empty_like(buf)
+        length = _normalize_ascii_jit(buf, out)
+        return out[:length].tobytes().decode('ascii')
+
+    # 문자열/숫자 리터럴을 한 번의 스캔으로 치환한 뒤 불필요한 공백 제거
+    return _WS_PATTERN.sub(' ', _NORM_PATTERN.sub('?', query)).strip()
+
+
+# 슬로우 쿼리 블록 패턴
+# 로그 이벤트는 "\x00\n"으로 이어 붙여 분석하며, 패턴은 이벤트 경계를 넘지 않음
+# 블록은 라인 시작에 고정하고 각 구간은 문자 클래스로 한 번에 스캔 (역추적 없음)
+# - Rows_examined 이후 SET timestamp 전까지는 'S'로 시작하지 않는 라인(use db; 등)을 건너뜀
+# - 쿼리 본문은 '#'으로 시작하지 않는 후속 라인 (RE2 호환을 위해 lookahead 미사용)
+SLOW_QUERY_PATTERN = (
+    r"(?m)^# User@Host: (?P<user>[^\[\x00\n]*)\[[^\]\x00\n]*\] @ (?P<host>[^\x00\n]*\n)"
+    r"# Query_time: (?P<query_time>\d+\.\d+)\s+"
+    r"Lock_time: (?P<lock_time>\d+\.\d+)\s+"
+    r"Rows_sent: (?P<rows_sent>\d+)\s+"
+    r"Rows_examined: (?P<rows_examined>\d+)[^\x00\n]*\n"
+    r"(?:[^S\x00\n][^\x00\n]*\n|\n)*"
+    r"SET timestamp=(?P<timestamp>\d+);"
+    r"(?P<query>(?:[^#\x00\n][^\x00\n]*|\n)*)"
+)
+EXCLUDED_USERS = ('rdsadmin', 'event_scheduler')  # 제외할 시스템 계정 목록
+# 시스템 계정 제외 lookahead (표준 re 전용): 사용자명에 제외 계정이 포함되면 매칭 실패
+_USER_GROUP = r"(?P<user>[^\[\x00\n]*)"
+_SYSTEM_USER_LOOKAHEAD = (
+    r"(?!(?i:[^\[\x00\n]*(?:" + "|".join(map(re.escape, EXCLUDED_USERS)) + r")))"
+)
+# 시스템 계정 블록 헤더 패턴 (표준 re는 lookahead로 블록 매칭 자체를 생략하므로 헤더로 개수 집계)
+_SYSTEM_USER_HEADER_PATTERN = re.compile(
+    r"(?m)^# User@Host: (?i:[^\[\x00\n]*(?:" + "|".join(map(re.escape, EXCLUDED_USERS)) + r"))"
+)
+MAX_EXAMPLE_QUERIES = 10
+ANALYSIS_CHUNK_SIZE = 5000  # 프로세스 풀 작업 단위 (로그 이벤트 수)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Tuple[Any, bool]:
+    """
+    RE2(선형 시간 DFA) 사용 가능 시 RE2로, 아니면 표준 re로 패턴 컴파일
+
+    Returns:
+        Tuple[Any, bool]: 컴파일된 패턴, 매칭 단계에서 시스템 계정 제외 여부
+    """
+    if re2 is not None:
+        try:
+            # RE2는 lookahead를 지원하지 않으므로 시스템 계정은 매칭 후 제외
+            return re2.compile(pattern), False
+        except Exception as e:
+            logger.warning(f"RE2 패턴 컴파일 실패, 표준 re 사용: {e}")
+
+    # 표준 re는 시스템 계정 블록을 User@Host 라인에서 바로 실패시켜 이후 구간 스캔을 생략
+    return re.compile(pattern.replace(_USER_GROUP, _SYSTEM_USER_LOOKAHEAD + _USER_GROUP, 1)), True
+
+
+class _DigestStat:
+    """다이제스트별 슬로우 쿼리 누적 통계"""
+
+    __slots__ = (
+        'digest_query', 'example_queries', 'execution_count',
+        'total_time', 'lock_time', 'rows_sent', 'rows_examined',
+        'users', 'hosts', 'first_seen', 'last_seen'
+    )
+
+    def __init__(self, digest_query: str):
+        self.digest_query = digest_query
+        # 항목 수가 적어 set 대신 list로 중복 제거
+        self.example_queries: List[str] = []
+        self.execution_count = 0
+        self.total_time = 0.0
+        self.lock_time = 0.0
+        self.rows_sent = 0
+        self.rows_examined = 0
+        self.users: List[str] = []
+        self.hosts: List[str] = []
+        # 발생 시각은 epoch 초(int)로 비교하고 결과 변환 시에만 datetime으로 변환
+        self.first_seen: Optional[int] = None
+        self.last_seen: Optional[int] = None
+
+    def add_example_query(self, query: str) -> None:
+        """예시 쿼리 추가 (최대 MAX_EXAMPLE_QUERIES개)"""
+        if len(self.example_queries) < MAX_EXAMPLE_QUERIES and query not in self.example_queries:
+            self.example_queries.append(query)
+
+    def add_user(self, user: str) -> None:
+        """실행 사용자 추가"""
+        if user not in self.users:
+            self.users.append(user)
+
+    def add_host(self, host: str) -> None:
+        """접속 호스트 추가"""
+        if host not in self.hosts:
+            self.hosts.append(host)
+
+    def update_seen(self, first_seen: int, last_seen: int) -> None:
+        """최초/최종 발생 시각 갱신"""
+        if self.first_seen is None or first_seen < self.first_seen:
+            self.first_seen = first_seen
+        if self.last_seen is None or last_seen > self.last_seen:
+            self.last_seen = last_seen
+
+    def merge(self, other: '_DigestStat') -> None:
+        """다른 부분 통계를 병합"""
+        self.execution_count += other.execution_count
+        self.total_time += other.total_time
+        self.lock_time += other.lock_time
+        self.rows_sent += other.rows_sent
+        self.rows_examined += other.rows_examined
+        for user in other.users:
+            self.add_user(user)
+        for host in other.hosts:
+            self.add_host(host)
+        for query in other.example_queries:
+            self.add_example_query(query)
+        self.update_seen(other.first_seen, other.last_seen)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저장용 결과 딕셔너리 변환"""
+        return {
+            'digest_query': self.digest_query,
+            'example_queries': self.example_queries,  # 이미 10개로 제한됨
+            'execution_count': self.execution_count,
+            'avg_time': self.total_time / self.execution_count,
+            'total_time': self.total_time,
+            'avg_lock_time': self.lock_time / self.execution_count,
+            'avg_rows_sent': self.rows_sent / self.execution_count,
+            'avg_rows_examined': self.rows_examined / self.execution_count,
+            'users': self.users,
+            'hosts': self.hosts,
+            'first_seen': datetime.fromtimestamp(self.first_seen).isoformat(),
+            'last_seen': datetime.fromtimestamp(self.last_seen).isoformat()
+        }
+
+
+def _analyze_chunk(messages: List[str], pattern: str) -> Tuple[Dict[str, _DigestStat], int, int]:
+    """로그 메시지 청크 분석 (프로세스 풀 워커에서 실행)
+
+    Args:
+        messages: 슬로우 쿼리 블록이 포함된 로그 메시지 목록
+        pattern: 슬로우 쿼리 블록 패턴
+
+    Returns:
+        Tuple[Dict[str, _DigestStat], int, int]: 다이제스트별 부분 통계, 처리된 쿼리 수, 시스템 계정 쿼리 수
+    """
+    query_stats = {}
+    processed_query_count = 0
+    system_query_count = 0
+    _float = float
+    _int = int
+
+    compiled_pattern, excludes_system_users = _compile_pattern(pattern)
+    text = "\x00\n".join(messages)
+
+    if excludes_system_users:
+        system_query_count = len(_SYSTEM_USER_HEADER_PATTERN.findall(text))
+
+    # 한 이벤트에 여러 블록이 있는 경우도 모두 수집
+    for match in compiled_pattern.finditer(text):
+        # 그룹 순서: user, host, query_time, lock_time, rows_sent, rows_examined, timestamp, query
+        user, host, query_time, lock_time, rows_sent, rows_examined, timestamp, query = match.group(
+            1, 2, 3, 4, 5, 6, 7, 8
+        )
+        # 시스템 계정이 실행한 쿼리는 제외 (패턴에서 제외하지 못한 경우)
+        if not excludes_system_users:
+            lowered_user = user.lower()
+            if any(excluded in lowered_user for excluded in EXCLUDED_USERS):
+                system_query_count += 1
+                continue
+
+        normalized_query = _normalize_query_cached(query)
+        processed_query_count += 1
+
+        stats = query_stats.get(normalized_query)
+        if stats is None:
+            stats = query_stats[normalized_query] = _DigestStat(normalized_query)
+
+        stats.execution_count += 1
+        stats.total_time += _float(query_time)
+        stats.lock_time += _float(lock_time)
+        stats.rows_sent += _int(rows_sent)
+        stats.rows_examined += _int(rows_examined)
+        stats.add_user(user)
+        stats.add_host(host)
+
+        # example_queries는 10개까지만 저장
+        stats.add_example_query(query.strip())
+
+        seen_at = _int(timestamp)
+        stats.update_seen(seen_at, seen_at)
+
+    return query_stats, processed_query_count, system_query_count
+
+
+def _merge_query_stats(
+        query_stats: Dict[str, _DigestStat],
+        partial_stats: Dict[str, _DigestStat]
+) -> None:
+    """청크별 부분 통계를 전체 통계에 병합"""
+    for digest, partial in partial_stats.items():
+        stats = query_stats.get(digest)
+        if stats is None:
+            query_stats[digest] = partial
+        else:
+            stats.merge(partial)
 
 
 class RDSCloudWatchSlowQueryCollector:
     """RDS CloudWatch 슬로우 쿼리 수집기"""
 
+    MAX_CONCURRENT_FETCHES = 8  # 동시 로그 이벤트 조회 요청 수
+    INSIGHTS_RESULT_LIMIT = 10000  # Logs Insights 쿼리 결과 최대 행 수
+    INSIGHTS_QUERY = (
+        "fields @message "
+        "| filter @message like /# User@Host:/ "
+        f"| limit {INSIGHTS_RESULT_LIMIT}"
+    )
+    INSIGHTS_POLL_INTERVAL = 1.0  # Logs Insights 결과 확인 간격 (초)
+    INSIGHTS_MAX_WAIT = 300  # Logs Insights 결과 최대 대기 시간 (초), 초과 시 FilterLogEvents로 전환
+    SLOW_QUERY_FILTER_PATTERN = '"# User@Host:"'  # FilterLogEvents 서버 측 필터
+    FETCH_WINDOW = timedelta(hours=1)  # FilterLogEvents 병렬 조회 시간 구간
+
     def __init__(self, session_manager: AWSSessionManager):
         """
         Args:
@@ -36,16 +351,9 @@ class RDSCloudWatchSlowQueryCollector:
         self.session_manager = session_manager
         self._instance_info = self.session_manager.get_instance_info()
         self.target_instances = ReportSettings.get_report_target_instances()
-        self._query_pattern = re.compile(
-            r"# User@Host: (?P<user>.*?)\[.*?\] @ (?P<host>.*?)"
-            r"# Query_time: (?P<query_time>\d+\.\d+)\s+"
-            r"Lock_time: (?P<lock_time>\d+\.\d+)\s+"
-            r"Rows_sent: (?P<rows_sent>\d+)\s+"
-            r"Rows_examined: (?P<rows_examined>\d+)"
-            r".*?SET timestamp=(?P<timestamp>\d+);"
-            r"(?P<query>.*?)(?=# User@Host:|$)",
-            re.DOTALL
-        )
+        self._target_instance_set = ReportSettings.get_report_target_instance_set()
+        self._fetch_limiter = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        self._logs_clients: Dict[Tuple[str, str], Any] = {}
 
         if self.target_instances:
             logger.info(f"수집 대상 인스턴스: {', '.join(self.target_instances)}")
@@ -116,6 +424,9 @@ class RDSCloudWatchSlowQueryCollector:
         except Exception as e:
             logger.error(f"일간 슬로우 쿼리 수집 중 오류 발생: {e}")
             raise
+        finally:
+            # 정규화 캐시 메모리 해제
+            _normalize_query_cached.cache_clear()
 
     async def _collect_account_slow_queries(
             self,
@@ -130,7 +441,7 @@ class RDSCloudWatchSlowQueryCollector:
             # 대상 인스턴스만 필터링
             target_instances = [
                 instance for instance in account.instances
-                if instance.instance_identifier in self.target_instances
+                if instance.instance_identifier in self._target_instance_set
             ]
 
             if not target_instances:
@@ -147,22 +458,22 @@ class RDSCloudWatchSlowQueryCollector:
                 )
 
                 try:
-                    logs = await self._get_slow_query_logs(
-                        account_id=account.account_id,
-                        instance=instance,
-                        start_date=start_date,
-                        end_date=end_date
+                    # 로그 페이지를 조회하는 대로 분석 (전체 로그를 메모리에 보관하지 않음)
+                    analyzed_queries = await self._analyze_slow_queries(
+                        self._get_slow_query_logs(
+                            account_id=account.account_id,
+                            instance=instance,
+                            start_date=start_date,
+                            end_date=end_date
+                        )
                     )
 
-                    if logs:
-                        # 쿼리 분석 및 통계 계산
-                        analyzed_queries = self._analyze_slow_queries(logs)
-                        if analyzed_queries:
-                            instance_queries[instance.instance_identifier] = analyzed_queries
-                            logger.info(
-                                f"✓ {instance.instance_identifier}: "
-                                f"{len(analyzed_queries)} 개의 슬로우 쿼리 분석 완료"
-                            )
+                    if analyzed_queries:
+                        instance_queries[instance.instance_identifier] = analyzed_queries
+                        logger.info(
+                            f"✓ {instance.instance_identifier}: "
+                            f"{len(analyzed_queries)} 개의 슬로우 쿼리 분석 완료"
+                        )
                     else:
                         logger.info(
                             f"- {instance.instance_identifier}: "
@@ -179,181 +490,235 @@ class RDSCloudWatchSlowQueryCollector:
             logger.error(f"계정 {account.account_id}의 슬로우 쿼리 수집 중 오류: {e}")
             raise
 
+    async def _get_logs_client(self, account_id: str, region: str) -> Any:
+        """계정/리전별 CloudWatch Logs 비동기 클라이언트 반환 (재사용)"""
+        key = (account_id, region)
+        client = self._logs_clients.get(key)
+        if client is None:
+            client = await self.session_manager.get_async_client('logs', account_id, region)
+            self._logs_clients[key] = client
+        return client
+
     async def _get_slow_query_logs(
             self,
             account_id: str,
             instance: Any,
             start_date: datetime,
             end_date: datetime
-    ) -> List[Dict]:
-        """CloudWatch Logs에서 슬로우 쿼리 로그 조회"""
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        CloudWatch Logs에서 슬로우 쿼리 로그를 페이지 단위로 조회
+        - Logs Insights로 슬로우 쿼리 블록이 있는 이벤트만 서버에서 필터링하여 조회
+        - Insights 조회 실패 또는 결과가 한도를 넘는 경우 FilterLogEvents로 시간 구간별 병렬 조회
+        """
         try:
-            logs_client = self.session_manager.get_client(
-                'logs',
-                account_id,
-                instance.region
-            )
+            logs_client = await self._get_logs_client(account_id, instance.region)
 
             log_group_name = f"/aws/rds/instance/{instance.instance_identifier}/slowquery"
 
+            events = await self._query_slow_query_logs(
+                logs_client,
+                log_group_name,
+                start_date,
+                end_date
+            )
+            if events is not None:
+                if events:
+                    yield events
+                return
+
+            # 조회 기간을 시간 구간으로 나누어 구간별 조회 작업이 페이지를 큐에 적재하고,
+            # 모든 작업 종료 시 None 전달
+            windows = []
+            window_start = start_date
+            while window_start <= end_date:
+                window_end = min(window_start + self.FETCH_WINDOW, end_date)
+                windows.append((window_start, window_end))
+                window_start = window_end + timedelta(milliseconds=1)
+
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_CONCURRENT_FETCHES * 2)
+
+            async def drain_windows() -> None:
+                await asyncio.gather(*(
+                    self._drain_log_window(
+                        logs_client,
+                        log_group_name,
+                        window_start,
+                        window_end,
+                        queue
+                    )
+                    for window_start, window_end in windows
+                ))
+                await queue.put(None)
+
+            producer = asyncio.create_task(drain_windows())
             try:
-                # 로그 스트림 조회
-                streams_response = await asyncio.to_thread(
-                    logs_client.describe_log_streams,
-                    logGroupName=log_group_name,
-                    orderBy='LastEventTime',
-                    descending=True,
-                    limit=50  # 스트림 개수 증가
-                )
-            except Exception as e:
-                logger.warning(f"로그 스트림 조회 실패 ({log_group_name}): {e}")
-                return []
+                while (events := await queue.get()) is not None:
+                    yield events
+            finally:
+                producer.cancel()
 
-            log_events = []
-            next_token = None
+        except Exception as e:
+            logger.error(f"로그 조회 중 오류 발생: {e}")
 
-            # 모든 로그 이벤트 수집
-            for stream in streams_response.get('logStreams', []):
-                while True:
-                    try:
-                        # get_log_events 파라미터 설정
-                        params = {
-                            'logGroupName': log_group_name,
-                            'logStreamName': stream['logStreamName'],
-                            'startTime': int(start_date.timestamp() * 1000),
-                            'endTime': int(end_date.timestamp() * 1000),
-                            'limit': 10000  # 최대 로그 이벤트 수 증가
-                        }
-
-                        if next_token:
-                            params['nextToken'] = next_token
-
-                        events_response = await asyncio.to_thread(
-                            logs_client.get_log_events,
-                            **params
-                        )
+    async def _query_slow_query_logs(
+            self,
+            logs_client: Any,
+            log_group_name: str,
+            start_date: datetime,
+            end_date: datetime
+    ) -> Optional[List[Dict]]:
+        """
+        CloudWatch Logs Insights로 슬로우 쿼리 로그 조회
 
-                        if events_response.get('events'):
-                            log_events.extend(events_response['events'])
+        Returns:
+            Optional[List[Dict]]: 로그 이벤트 목록 (조회 실패 또는 결과가 한도에 도달한 경우 None)
+        """
+        try:
+            query = await logs_client.start_query(
+                logGroupName=log_group_name,
+                startTime=int(start_date.timestamp()),
+                endTime=int(end_date.timestamp()),
+                queryString=self.INSIGHTS_QUERY
+            )
 
-                        # 다음 페이지 확인
-                        next_token = events_response.get('nextForwardToken')
+            deadline = asyncio.get_running_loop().time() + self.INSIGHTS_MAX_WAIT
+            while True:
+                response = await logs_client.get_query_results(queryId=query['queryId'])
+                status = response.get('status')
+                if status == 'Complete':
+                    break
+                if status in ('Failed', 'Cancelled', 'Timeout'):
+                    logger.warning(f"Logs Insights 쿼리 실패 ({log_group_name}): {status}")
+                    return None
+                if asyncio.get_running_loop().time() >= deadline:
+                    # Running/Scheduled 상태로 멈춘 쿼리는 중지하고 전체 로그 이벤트 조회로 전환
+                    logger.warning(
+                        f"Logs Insights 쿼리 대기 시간({self.INSIGHTS_MAX_WAIT}초) 초과 "
+                        f"({log_group_name}): {status}"
+                    )
+                    try:
+                        await logs_client.stop_query(queryId=query['queryId'])
+                    except Exception as e:
+                        logger.warning(f"Logs Insights 쿼리 중지 실패 ({log_group_name}): {e}")
+                    return None
+                await asyncio.sleep(self.INSIGHTS_POLL_INTERVAL)
 
-                        # 더 이상 로그가 없거나 토큰이 같으면 종료
-                        if not events_response.get('events') or next_token == params.get('nextToken'):
-                            break
+        except Exception as e:
+            logger.warning(f"Logs Insights 조회 실패 ({log_group_name}): {e}")
+            return None
 
-                    except Exception as e:
-                        logger.warning(f"로그 이벤트 조회 실패 ({stream['logStreamName']}): {e}")
-                        break
+        results = response.get('results', [])
+        if len(results) >= self.INSIGHTS_RESULT_LIMIT:
+            logger.info(
+                f"Logs Insights 결과가 한도({self.INSIGHTS_RESULT_LIMIT})에 도달하여 "
+                f"전체 로그 이벤트 조회로 전환 ({log_group_name})"
+            )
+            return None
 
-            logger.info(f"총 {len(log_events)}개의 로그 이벤트 수집됨")
-            return log_events
+        return [
+            {'message': field['value']}
+            for row in results
+            for field in row
+            if field.get('field') == '@message'
+        ]
+
+    async def _drain_log_window(
+            self,
+            logs_client: Any,
+            log_group_name: str,
+            start_date: datetime,
+            end_date: datetime,
+            queue: asyncio.Queue
+    ) -> None:
+        """시간 구간의 슬로우 쿼리 이벤트를 FilterLogEvents로 조회하여 큐에 적재 (전체 스트림 대상)"""
+        paginator = logs_client.get_paginator('filter_log_events')
+        try:
+            async with self._fetch_limiter:
+                async for page in paginator.paginate(
+                        logGroupName=log_group_name,
+                        startTime=int(start_date.timestamp() * 1000),
+                        endTime=int(end_date.timestamp() * 1000),
+                        filterPattern=self.SLOW_QUERY_FILTER_PATTERN,
+                        PaginationConfig={'PageSize': 10000}
+                ):
+                    if page.get('events'):
+                        await queue.put(page['events'])
 
         except Exception as e:
-            logger.error(f"로그 조회 중 오류 발생: {e}")
-            return []
+            logger.warning(
+                f"로그 이벤트 조회 실패 ({log_group_name}, "
+                f"{start_date.isoformat()} ~ {end_date.isoformat()}): {e}"
+            )
 
-    def _analyze_slow_queries(self, logs: List[Dict]) -> List[Dict]:
+    async def _analyze_slow_queries(self, pages: AsyncIterator[List[Dict]]) -> List[Dict]:
         """
         슬로우 쿼리 로그 분석
         - 모든 다이제스트 쿼리 패턴 수집 (시스템 계정 제외)
         - 각 다이제스트 당 example_queries는 10개로 제한
+
+        Args:
+            pages: 로그 이벤트 페이지 비동기 이터레이터
         """
+        loop = asyncio.get_running_loop()
+        # CloudWatch 로그 이벤트에는 항상 message 키가 존재
+        get_message = itemgetter('message')
         query_stats = {}
-        total_query_count = len(logs)
+        pending = []
+        total_event_count = 0
         processed_query_count = 0
-        excluded_users = {'rdsadmin', 'event_scheduler'}  # 제외할 시스템 계정 목록
+        system_query_count = 0
 
-        for log in logs:
-            match = self._query_pattern.search(log.get('message', ''))
-            if not match:
-                continue
+        async for events in pages:
+            total_event_count += len(events)
 
-            data = match.groupdict()
-            # 시스템 계정이 실행한 쿼리는 제외
-            if any(user in data['user'].lower() for user in excluded_users):
-                continue
-
-            normalized_query = self._normalize_query(data['query'])
-            processed_query_count += 1
-
-            if normalized_query not in query_stats:
-                query_stats[normalized_query] = {
-                    'digest_query': normalized_query,
-                    'example_queries': set(),
-                    'execution_count': 0,
-                    'total_time': 0.0,
-                    'lock_time': 0.0,
-                    'rows_sent': 0,
-                    'rows_examined': 0,
-                    'users': set(),
-                    'hosts': set(),
-                    'first_seen': None,
-                    'last_seen': None
-                }
+            # 슬로우 쿼리 블록이 있는 메시지만 분석 대상으로 사용
+            messages = [
+                message
+                for message in map(get_message, events)
+                if '# User@Host:' in message
+            ]
 
-            stats = query_stats[normalized_query]
-            stats['execution_count'] += 1
-            stats['total_time'] += float(data['query_time'])
-            stats['lock_time'] += float(data['lock_time'])
-            stats['rows_sent'] += int(data['rows_sent'])
-            stats['rows_examined'] += int(data['rows_examined'])
-            stats['users'].add(data['user'])
-            stats['hosts'].add(data['host'])
-
-            # example_queries는 10개까지만 저장
-            if len(stats['example_queries']) < 10:
-                stats['example_queries'].add(data['query'].strip())
-
-            timestamp = datetime.fromtimestamp(int(data['timestamp']))
-            if not stats['first_seen'] or timestamp < stats['first_seen']:
-                stats['first_seen'] = timestamp
-            if not stats['last_seen'] or timestamp > stats['last_seen']:
-                stats['last_seen'] = timestamp
-
-        # 결과 정리
-        system_query_count = total_query_count - processed_query_count
+            if len(messages) > ANALYSIS_CHUNK_SIZE:
+                # 대량 페이지는 프로세스 풀에서 분석하여 다음 페이지 조회와 겹쳐 실행
+                pending.extend(
+                    loop.run_in_executor(
+                        get_analysis_pool(),
+                        _analyze_chunk,
+                        messages[i:i + ANALYSIS_CHUNK_SIZE],
+                        SLOW_QUERY_PATTERN
+                    )
+                    for i in range(0, len(messages), ANALYSIS_CHUNK_SIZE)
+                )
+            elif messages:
+                # 소량은 프로세스 간 전달 비용이 더 크므로 바로 분석
+                partial_stats, processed, system = _analyze_chunk(messages, SLOW_QUERY_PATTERN)
+                processed_query_count += processed
+                system_query_count += system
+                _merge_query_stats(query_stats, partial_stats)
+
+        for partial_stats, processed, system in await asyncio.gather(*pending):
+            processed_query_count += processed
+            system_query_count += system
+            _merge_query_stats(query_stats, partial_stats)
+
+        # 결과 정리 (한 이벤트에 여러 블록이 있을 수 있으므로 쿼리 수는 블록 단위로 집계)
         logger.info(
-            f"전체 쿼리 수: {total_query_count}, "
+            f"로그 이벤트 수: {total_event_count}, "
+            f"전체 쿼리 수: {processed_query_count + system_query_count}, "
             f"시스템 계정 쿼리 수: {system_query_count}, "
             f"처리된 쿼리 수: {processed_query_count}, "
             f"고유 다이제스트 수: {len(query_stats)}"
         )
 
-        results = []
-        for stats in query_stats.values():
-            results.append({
-                'digest_query': stats['digest_query'],
-                'example_queries': list(stats['example_queries']),  # 이미 10개로 제한됨
-                'execution_count': stats['execution_count'],
-                'avg_time': stats['total_time'] / stats['execution_count'],
-                'total_time': stats['total_time'],
-                'avg_lock_time': stats['lock_time'] / stats['execution_count'],
-                'avg_rows_sent': stats['rows_sent'] / stats['execution_count'],
-                'avg_rows_examined': stats['rows_examined'] / stats['execution_count'],
-                'users': list(stats['users']),
-                'hosts': list(stats['hosts']),
-                'first_seen': stats['first_seen'].isoformat(),
-                'last_seen': stats['last_seen'].isoformat()
-            })
+        results = [stats.to_dict() for stats in query_stats.values()]
 
         # 평균 실행 시간으로 정렬 (제한 없음)
         return sorted(results, key=lambda x: x['avg_time'], reverse=True)
 
     def _normalize_query(self, query: str) -> str:
         """쿼리 정규화 (변수 값을 플레이스홀더로 대체)"""
-        # 문자열 리터럴 제거
-        query = re.sub(r"'[^']*'", "?", query)
-        query = re.sub(r'"[^"]*"', "?", query)
-
-        # 숫자 리터럴 제거
-        query = re.sub(r'\b\d+\b', "?", query)
-
-        # 불필요한 공백 제거
-        query = " ".join(query.split())
-
-        return query
+        return _normalize_query_cached(query)
 
     async def _save_daily_metrics(
             self,
@@ -365,6 +730,10 @@ class RDSCloudWatchSlowQueryCollector:
             db = await MongoDBConnector.get_database()
             collection = db[self.collection_name]
 
+            # 인스턴스별 upsert 작업 구성
+            operations = []
+            instance_ids = []
+            created_at = datetime.now(kst).isoformat()
             for account_id, instance_queries in account_queries.items():
                 for instance_id, queries in instance_queries.items():
                     document = {
@@ -376,7 +745,7 @@ class RDSCloudWatchSlowQueryCollector:
                         "account_id": account_id,
                         "instance_id": instance_id,
                         "slow_queries": queries,
-                        "created_at": datetime.now(kst).isoformat()
+                        "created_at": created_at
                     }
 
                     filter_doc = {
@@ -386,25 +755,15 @@ class RDSCloudWatchSlowQueryCollector:
                         "instance_id": instance_id
                     }
 
-                    try:
-                        result = await collection.update_one(
-                            filter_doc,
-                            {"$set": document},
-                            upsert=True
-                        )
-
-                        operation = "업데이트" if result.modified_count else "생성"
-                        logger.info(
-                            f"인스턴스 {instance_id}의 "
-                            f"{target_date.strftime('%Y-%m-%d')} "
-                            f"슬로우 쿼리 도큐먼트 {operation} 완료"
-                        )
+                    operations.append(UpdateOne(filter_doc, {"$set": document}, upsert=True))
+                    instance_ids.append(instance_id)
 
-                    except Exception as e:
-                        logger.error(
-                            f"인스턴스 {instance_id} 슬로우 쿼리 저장 실패: {str(e)}"
-                        )
-                        continue
+            await self._bulk_upsert(
+                collection,
+                operations,
+                instance_ids,
+                target_date.strftime('%Y-%m-%d')
+            )
 
         except Exception as e:
             logger.error(f"MongoDB 저장 중 오류 발생: {e}")
@@ -414,7 +773,7 @@ class RDSCloudWatchSlowQueryCollector:
             self,
             year: int,
             month: int
-    ) -> Dict[str, Any]:
+    ) -> Dict[str, Dict[str, int]]:
         """
         월 단위 슬로우 쿼리 수집
 
@@ -423,7 +782,7 @@ class RDSCloudWatchSlowQueryCollector:
             month: 수집 월
 
         Returns:
-            Dict[str, Any]: 계정별, 인스턴스별 수집된 슬로우 쿼리
+            Dict[str, Dict[str, int]]: 계정별, 인스턴스별 슬로우 쿼리가 수집된 일수
         """
         try:
             if not self._instance_info:
@@ -445,8 +804,8 @@ class RDSCloudWatchSlowQueryCollector:
                 f"{len(self._instance_info.accounts)}개 계정"
             )
 
-            # 일별 데이터 수집
-            all_account_queries = {}
+            # 일별 데이터 수집 (월간 통계는 저장된 일간 도큐먼트로 집계하므로 수집 일수만 기록)
+            collected_days: Dict[str, Dict[str, int]] = {}
             current_date = start_date
 
             while current_date <= end_date:
@@ -455,149 +814,206 @@ class RDSCloudWatchSlowQueryCollector:
                 # 일별 데이터 수집
                 daily_queries = await self.collect_metrics_daily(current_date)
 
-                # 데이터 병합
                 for account_id, instance_queries in daily_queries.items():
-                    if account_id not in all_account_queries:
-                        all_account_queries[account_id] = {}
-
-                    for instance_id, queries in instance_queries.items():
-                        if instance_id not in all_account_queries[account_id]:
-                            all_account_queries[account_id][instance_id] = []
-
-                        all_account_queries[account_id][instance_id].extend(queries)
+                    account_days = collected_days.setdefault(account_id, {})
+                    for instance_id in instance_queries:
+                        account_days[instance_id] = account_days.get(instance_id, 0) + 1
 
                 current_date += timedelta(days=1)
 
-            if not all_account_queries:
+            if not collected_days:
                 logger.warning("수집된 슬로우 쿼리가 없습니다")
                 return {}
 
-            # 월간 데이터 정리 및 저장
-            await self._save_monthly_metrics(
-                account_queries=all_account_queries,
-                year=year,
-                month=month
-            )
+            # 저장된 일간 도큐먼트를 MongoDB에서 집계하여 월간 데이터 저장
+            await self._save_monthly_metrics(year=year, month=month)
 
-            return all_account_queries
+            return collected_days
 
         except Exception as e:
             logger.error(f"월간 슬로우 쿼리 수집 중 오류 발생: {e}")
             raise
 
-    async def _save_monthly_metrics(
-            self,
-            account_queries: Dict[str, Dict],
-            year: int,
-            month: int
-    ) -> None:
-        """월간 슬로우 쿼리 데이터를 MongoDB에 저장"""
-        try:
-            db = await MongoDBConnector.get_database()
-            collection = db[f"{self.collection_name}_monthly"]  # 월간 데이터는 별도 컬렉션에 저장
+    def _monthly_summary_pipeline(self, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        일간 슬로우 쿼리 도큐먼트를 인스턴스/다이제스트별로 집계하는 파이프라인
 
-            for account_id, instance_queries in account_queries.items():
-                for instance_id, queries in instance_queries.items():
-                    # 쿼리 다이제스트별 통계 계산
-                    digest_stats = {}
-                    for query in queries:
-                        digest = query['digest_query']
-                        if digest not in digest_stats:
-                            digest_stats[digest] = {
-                                'digest_query': digest,
-                                'example_queries': set(),
-                                'execution_count': 0,
-                                'total_time': 0.0,
-                                'lock_time': 0.0,
-                                'rows_sent': 0,
-                                'rows_examined': 0,
-                                'users': set(),
-                                'hosts': set(),
-                                'first_seen': None,
-                                'last_seen': None
-                            }
-
-                        stats = digest_stats[digest]
-                        stats['execution_count'] += query['execution_count']
-                        stats['total_time'] += query['total_time']
-                        stats['lock_time'] += query['avg_lock_time'] * query['execution_count']
-                        stats['rows_sent'] += query['avg_rows_sent'] * query['execution_count']
-                        stats['rows_examined'] += query['avg_rows_examined'] * query['execution_count']
-                        stats['example_queries'].update(query['example_queries'])
-                        stats['users'].update(query['users'])
-                        stats['hosts'].update(query['hosts'])
-
-                        first_seen = datetime.fromisoformat(query['first_seen'])
-                        last_seen = datetime.fromisoformat(query['last_seen'])
-
-                        if not stats['first_seen'] or first_seen < stats['first_seen']:
-                            stats['first_seen'] = first_seen
-                        if not stats['last_seen'] or last_seen > stats['last_seen']:
-                            stats['last_seen'] = last_seen
-
-                    # 통계 변환
-                    monthly_stats = []
-                    for stats in digest_stats.values():
-                        monthly_stats.append({
-                            'digest_query': stats['digest_query'],
-                            'example_queries': list(stats['example_queries'])[:10],
-                            'execution_count': stats['execution_count'],
-                            'avg_time': stats['total_time'] / stats['execution_count'],
-                            'total_time': stats['total_time'],
-                            'avg_lock_time': stats['lock_time'] / stats['execution_count'],
-                            'avg_rows_sent': stats['rows_sent'] / stats['execution_count'],
-                            'avg_rows_examined': stats['rows_examined'] / stats['execution_count'],
-                            'users': list(stats['users']),
-                            'hosts': list(stats['hosts']),
-                            'first_seen': stats['first_seen'].isoformat(),
-                            'last_seen': stats['last_seen'].isoformat()
-                        })
-
-                    # 평균 실행 시간 기준 정렬
-                    monthly_stats.sort(key=lambda x: x['avg_time'], reverse=True)
+        Args:
+            year: 집계 연도
+            month: 집계 월
 
-                    document = {
-                        "env": self._instance_info.env,
-                        "year": year,
-                        "month": month,
-                        "account_id": account_id,
-                        "instance_id": instance_id,
-                        "slow_queries": monthly_stats,
-                        "created_at": datetime.now(kst).isoformat()
-                    }
+        Returns:
+            List[Dict[str, Any]]: 인스턴스별 월간 슬로우 쿼리 목록을 반환하는 집계 파이프라인
+        """
 
-                    filter_doc = {
-                        "env": document["env"],
-                        "year": year,
-                        "month": month,
-                        "account_id": account_id,
-                        "instance_id": instance_id
+        def flatten(field: str) -> Dict[str, Any]:
+            """일별 배열 목록을 하나의 중복 없는 배열로 변환"""
+            return {
+                "$setUnion": [{
+                    "$reduce": {
+                        "input": f"${field}",
+                        "initialValue": [],
+                        "in": {"$concatArrays": ["$$value", "$$this"]}
+                    }
+                }]
+            }
+
+        return [
+            {
+                "$match": {
+                    "env": self._instance_info.env,
+                    "year": year,
+                    "month": month,
+                    "instance_id": {"$in": list(self.target_instances)}
+                }
+            },
+            {"$unwind": "$slow_queries"},
+            {
+                "$group": {
+                    "_id": {
+                        "account_id": "$account_id",
+                        "instance_id": "$instance_id",
+                        "digest_query": "$slow_queries.digest_query"
+                    },
+                    "execution_count": {"$sum": "$slow_queries.execution_count"},
+                    "total_time": {"$sum": "$slow_queries.total_time"},
+                    "lock_time": {"$sum": {
+                        "$multiply": ["$slow_queries.avg_lock_time", "$slow_queries.execution_count"]
+                    }},
+                    "rows_sent": {"$sum": {
+                        "$multiply": ["$slow_queries.avg_rows_sent", "$slow_queries.execution_count"]
+                    }},
+                    "rows_examined": {"$sum": {
+                        "$multiply": ["$slow_queries.avg_rows_examined", "$slow_queries.execution_count"]
+                    }},
+                    "example_queries": {"$push": "$slow_queries.example_queries"},
+                    "users": {"$push": "$slow_queries.users"},
+                    "hosts": {"$push": "$slow_queries.hosts"},
+                    # ISO 8601 문자열은 사전순 비교가 시간순과 동일
+                    "first_seen": {"$min": "$slow_queries.first_seen"},
+                    "last_seen": {"$max": "$slow_queries.last_seen"}
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "account_id": "$_id.account_id",
+                    "instance_id": "$_id.instance_id",
+                    "query": {
+                        "digest_query": "$_id.digest_query",
+                        "example_queries": {"$slice": [flatten("example_queries"), MAX_EXAMPLE_QUERIES]},
+                        "execution_count": "$execution_count",
+                        "avg_time": {"$divide": ["$total_time", "$execution_count"]},
+                        "total_time": "$total_time",
+                        "avg_lock_time": {"$divide": ["$lock_time", "$execution_count"]},
+                        "avg_rows_sent": {"$divide": ["$rows_sent", "$execution_count"]},
+                        "avg_rows_examined": {"$divide": ["$rows_examined", "$execution_count"]},
+                        "users": flatten("users"),
+                        "hosts": flatten("hosts"),
+                        "first_seen": "$first_seen",
+                        "last_seen": "$last_seen"
                     }
+                }
+            },
+            # 평균 실행 시간 기준 정렬 후 인스턴스별로 묶음
+            {"$sort": {"query.avg_time": -1}},
+            {
+                "$group": {
+                    "_id": {"account_id": "$account_id", "instance_id": "$instance_id"},
+                    "slow_queries": {"$push": "$query"}
+                }
+            }
+        ]
 
-                    try:
-                        result = await collection.update_one(
-                            filter_doc,
-                            {"$set": document},
-                            upsert=True
-                        )
+    async def _save_monthly_metrics(self, year: int, month: int) -> None:
+        """
+        월간 슬로우 쿼리 데이터를 MongoDB에 저장
+        - 다이제스트별 통계는 저장된 일간 도큐먼트를 MongoDB 집계로 계산
 
-                        operation = "업데이트" if result.modified_count else "생성"
-                        logger.info(
-                            f"인스턴스 {instance_id}의 "
-                            f"{year}년 {month}월 "
-                            f"슬로우 쿼리 도큐먼트 {operation} 완료"
-                        )
+        Args:
+            year: 수집 연도
+            month: 수집 월
+        """
+        try:
+            db = await MongoDBConnector.get_database()
+            daily_collection = db[self.collection_name]
+            collection = db[f"{self.collection_name}_monthly"]  # 월간 데이터는 별도 컬렉션에 저장
 
-                    except Exception as e:
-                        logger.error(
-                            f"인스턴스 {instance_id} 월간 슬로우 쿼리 저장 실패: {str(e)}"
-                        )
-                        continue
+            # 인스턴스별 upsert 작업 구성
+            operations = []
+            instance_ids = []
+            created_at = datetime.now(kst).isoformat()
+            async for summary in daily_collection.aggregate(
+                    self._monthly_summary_pipeline(year, month),
+                    allowDiskUse=True
+            ):
+                account_id = summary['_id']['account_id']
+                instance_id = summary['_id']['instance_id']
+
+                document = {
+                    "env": self._instance_info.env,
+                    "year": year,
+                    "month": month,
+                    "account_id": account_id,
+                    "instance_id": instance_id,
+                    "slow_queries": summary['slow_queries'],
+                    "created_at": created_at
+                }
+
+                filter_doc = {
+                    "env": document["env"],
+                    "year": year,
+                    "month": month,
+                    "account_id": account_id,
+                    "instance_id": instance_id
+                }
+
+                operations.append(UpdateOne(filter_doc, {"$set": document}, upsert=True))
+                instance_ids.append(instance_id)
+
+            await self._bulk_upsert(collection, operations, instance_ids, f"{year}년 {month}월")
 
         except Exception as e:
             logger.error(f"MongoDB 저장 중 오류 발생: {e}")
             raise
 
+    async def _bulk_upsert(
+            self,
+            collection: Any,
+            operations: List[UpdateOne],
+            instance_ids: List[str],
+            period: str
+    ) -> None:
+        """
+        인스턴스별 upsert 작업을 한 번의 요청으로 저장 (개별 실패는 나머지 저장에 영향 없음)
+
+        Args:
+            collection: 저장 대상 컬렉션
+            operations: upsert 작업 목록
+            instance_ids: 작업 순서와 같은 인스턴스 ID 목록 (오류 로깅용)
+            period: 로그에 표시할 수집 기간
+        """
+        if not operations:
+            return
+
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+            bulk_result = result.bulk_api_result
+        except BulkWriteError as e:
+            bulk_result = e.details
+            for error in bulk_result.get('writeErrors', []):
+                logger.error(
+                    f"인스턴스 {instance_ids[error['index']]} "
+                    f"슬로우 쿼리 저장 실패: {error.get('errmsg')}"
+                )
+
+        logger.info(
+            f"{period} 슬로우 쿼리 도큐먼트 저장 완료 "
+            f"(생성: {bulk_result.get('nUpserted', 0)}, "
+            f"업데이트: {bulk_result.get('nModified', 0)}, "
+            f"전체: {len(operations)}개 인스턴스)"
+        )
+
 
 async def collect_slow_queries(
         target_date: Optional[datetime] = None,
@@ -610,6 +1026,15 @@ async def collect_slow_queries(
         target_date: 수집할 날짜 (기본값: 어제)
         mode: 수집 모드 ('daily' 또는 'monthly')
     """
+    # 다른 핸들러가 설정되지 않았고 리스너가 실행 중이 아닌 경우에만 큐 핸들러 연결 후 리스너 시작
+    # (동시/중첩 호출은 먼저 시작한 호출의 리스너를 공유하며, 시작한 호출만 종료)
+    root_logger = logging.getLogger()
+    with _log_listener_lock:
+        owns_log_listener = _log_listener._thread is None and not root_logger.handlers
+        if owns_log_listener:
+            root_logger.setLevel(logging.INFO)
+            root_logger.addHandler(_log_queue_handler)
+            _log_listener.start()
     try:
         target_instances = ReportSettings.get_report_target_instances()
         if not target_instances:
@@ -694,6 +1119,10 @@ async def collect_slow_queries(
             raise  # 상위 예외 처리기로 전파
 
         finally:
+            try:
+                await session_manager.close_async_clients()
+            except Exception as e:
+                logger.error(f"AWS 비동기 클라이언트 종료 중 오류 발생: {e}")
             try:
                 await MongoDBConnector.close()
             except Exception as e:
@@ -703,6 +1132,16 @@ async def collect_slow_queries(
         logger.error(f"프로그램 실행 중 오류 발생: {e}")
         sys.exit(1)
 
+    finally:
+        # 분석 워커 프로세스가 실행 종료 후에도 남지 않도록 종료
+        shutdown_analysis_pool()
+
+        # 큐 핸들러를 먼저 분리한 뒤 대기 중인 로그를 모두 출력하고 리스너 종료
+        if owns_log_listener:
+            with _log_listener_lock:
+                root_logger.removeHandler(_log_queue_handler)
+                _log_listener.stop()
+
 
 if __name__ == "__main__":
     import asyncio
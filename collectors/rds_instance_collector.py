@@ -1,35 +1,105 @@
 # collectors/rds_instance_collector.py
 
 import os
+import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 from botocore.exceptions import ClientError
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, InsertOne
+from pymongo.errors import BulkWriteError
 from models.aws_account import AWSAccountInDB
+from configs.mongo_conf import mongo_settings
 
 from modules.aws_session_manager import AWSSessionManager, EnvironmentType
 from modules.aws_account_module import AWSAccountModule
 
-# 로깅 설정
+__all__ = ['RDSInstanceCollector']
+
+# 로깅 설정 (basicConfig는 단독 실행 시에만 적용)
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# DescribeDBInstances 응답 키와 RDSInstanceRow 필드 매핑 (Endpoint, TagList는 별도 변환)
+_INSTANCE_SOURCE_KEYS = (
+    'DBInstanceIdentifier', 'DBInstanceClass', 'Engine', 'EngineVersion',
+    'DBInstanceStatus', 'MasterUsername', 'AllocatedStorage', 'AvailabilityZone',
+    'MultiAZ', 'StorageType', 'InstanceCreateTime'
+)
+_INSTANCE_FIELDS = (
+    'db_instance_identifier', 'db_instance_class', 'engine', 'engine_version',
+    'db_instance_status', 'master_username', 'allocated_storage', 'availability_zone',
+    'multi_az', 'storage_type', 'instance_create_time'
+)
+
+
+@dataclass(slots=True)
+class RDSInstanceRow:
+    """수집된 RDS 인스턴스 정보 (MongoDB 저장 시 도큐먼트로 변환)"""
+    account_id: str
+    region: str
+    db_instance_identifier: Optional[str]
+    db_instance_class: Optional[str]
+    engine: Optional[str]
+    engine_version: Optional[str]
+    endpoint: Optional[Dict[str, Any]]
+    db_instance_status: Optional[str]
+    master_username: Optional[str]
+    allocated_storage: Optional[int]
+    availability_zone: Optional[str]
+    multi_az: Optional[bool]
+    storage_type: Optional[str]
+    instance_create_time: Optional[datetime]
+    tags: Optional[Dict[str, str]]
+
+    def to_document(self) -> Dict[str, Any]:
+        """MongoDB 저장용 도큐먼트로 변환 (태그가 없으면 Tags 필드 생략)"""
+        document = {
+            'AccountId': self.account_id,
+            'Region': self.region,
+            'DBInstanceIdentifier': self.db_instance_identifier,
+            'DBInstanceClass': self.db_instance_class,
+            'Engine': self.engine,
+            'EngineVersion': self.engine_version,
+            'Endpoint': self.endpoint,
+            'DBInstanceStatus': self.db_instance_status,
+            'MasterUsername': self.master_username,
+            'AllocatedStorage': self.allocated_storage,
+            'AvailabilityZone': self.availability_zone,
+            'MultiAZ': self.multi_az,
+            'StorageType': self.storage_type,
+            'InstanceCreateTime': self.instance_create_time
+        }
+        if self.tags is not None:
+            document['Tags'] = self.tags
+        return document
+
 
 class RDSInstanceCollector:
     """AWS RDS 인스턴스 정보 수집기"""
 
+    MAX_CONCURRENT_REQUESTS = 8  # 동시 AWS API 요청 수 (스로틀링 방지)
+    INSERT_BATCH_SIZE = 1000  # 도큐먼트/저장 요청당 최대 인스턴스 수 (초과 시 나누어 저장)
+
     def __init__(self):
-        # MongoDB 설정
-        self.mongodb_uri = os.getenv('MONGODB_URI')
-        self.mongodb_db_name = os.getenv('MONGODB_DB_NAME')
-        self.collection_name = 'aws_rds_instance_all_stat'
+        # MongoDB 설정 (캐시된 설정 객체 재사용)
+        self.mongodb_uri = mongo_settings.MONGODB_URI
+        self.mongodb_db_name = mongo_settings.MONGODB_DB_NAME
+        self.collection_name = mongo_settings.MONGO_RDS_INSTANCE_ALL_STAT_COLLECTION
+        self._mongo_client: Optional[AsyncIOMotorClient] = None
 
         # 시간대 설정
         self.kst = timezone(timedelta(hours=9))
         self.datetime_format = "%Y-%m-%d %H:%M:%S KST"
+        self._run_ts: Optional[str] = None  # 수집 실행 단위 공통 타임스탬프
+
+        # 계정 간 공용 저장 대기 도큐먼트 (INSERT_BATCH_SIZE 단위로 한 번의 bulk 요청으로 저장)
+        self._pending_documents: List[dict] = []
+        self._pending_instances = 0
 
         # AWS 세션 관리자
         self.session_manager = AWSSessionManager()
@@ -37,6 +107,9 @@ class RDSInstanceCollector:
         # AWS 계정 모듈
         self.aws_account_module = AWSAccountModule()
 
+        # 계정/리전별 동시 조회 제한
+        self._limiter = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
     async def get_target_accounts(self, env: str) -> List[AWSAccountInDB]:
         """지정된 환경의 AWS 계정 정보 조회
 
@@ -68,88 +141,182 @@ class RDSInstanceCollector:
         utc_now = datetime.now(timezone.utc)
         return utc_now.astimezone(self.kst).strftime(self.datetime_format)
 
-    def convert_utc_to_kst(self, utc_time: Optional[datetime]) -> Optional[datetime]:
-        """UTC 시간을 KST로 변환"""
-        if utc_time is None:
-            return None
-        return utc_time.replace(tzinfo=timezone.utc).astimezone(self.kst)
-
-    def format_datetime(self, dt: Optional[datetime]) -> Optional[str]:
-        """datetime 객체를 문자열로 포맷팅"""
-        if dt is None:
-            return None
-        return dt.strftime(self.datetime_format)
-
-    async def get_rds_instances(self, account: AWSAccountInDB) -> List[dict]:
-        """특정 계정의 RDS 인스턴스 정보 수집
+    async def iter_rds_instances(self, account: AWSAccountInDB) -> AsyncIterator[List[RDSInstanceRow]]:
+        """특정 계정의 RDS 인스턴스 정보를 페이지 단위로 스트리밍 (리전 병렬 조회)
 
         Args:
             account: AWS 계정 정보 (계정ID와 리전 목록 포함)
+
+        Yields:
+            DescribeDBInstances 페이지별 인스턴스 정보 목록
         """
-        instances = []
         account_id = account.aws_account_id
 
-        for region in account.regions:
+        # 리전별 조회 결과를 큐로 모아 소비 (큐 크기 제한으로 저장 속도에 맞춰 조회)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, len(account.regions)) * 2)
+
+        async def produce(region: str) -> None:
+            try:
+                async for rows in self._collect_region(account_id, region):
+                    await queue.put(rows)
+            except asyncio.CancelledError:
+                # 소비 중단으로 취소된 경우 읽는 쪽이 없으므로 종료 신호를 보내지 않음
+                raise
+            except Exception:
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        tasks = [asyncio.create_task(produce(region)) for region in account.regions]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                rows = await queue.get()
+                if rows is None:
+                    remaining -= 1
+                    continue
+                yield rows
+
+            # 리전 조회 중 발생한 예외 전파
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_region(self, account_id: str, region: str) -> AsyncIterator[List[RDSInstanceRow]]:
+        """특정 계정/리전의 RDS 인스턴스 정보를 페이지 단위로 수집
+
+        Args:
+            account_id: AWS 계정 ID
+            region: AWS 리전
+        """
+        count = 0
+        async with self._limiter:
             try:
-                # AWS 세션 매니저를 통해 RDS 클라이언트 생성
-                rds = self.session_manager.get_client('rds', account_id, region)
+                # AWS 세션 매니저를 통해 RDS 비동기 클라이언트 생성
+                rds = await self.session_manager.get_async_client('rds', account_id, region)
                 paginator = rds.get_paginator('describe_db_instances')
 
-                for page in paginator.paginate():
-                    for db in page['DBInstances']:
-                        instance_data = {
-                            'AccountId': account_id,
-                            'Region': region,
-                            'DBInstanceIdentifier': db.get('DBInstanceIdentifier'),
-                            'DBInstanceClass': db.get('DBInstanceClass'),
-                            'Engine': db.get('Engine'),
-                            'EngineVersion': db.get('EngineVersion'),
-                            'Endpoint': {
-                                'Address': db.get('Endpoint', {}).get('Address'),
-                                'Port': db.get('Endpoint', {}).get('Port')
-                            } if db.get('Endpoint') else None,
-                            'DBInstanceStatus': db.get('DBInstanceStatus'),
-                            'MasterUsername': db.get('MasterUsername'),
-                            'AllocatedStorage': db.get('AllocatedStorage'),
-                            'AvailabilityZone': db.get('AvailabilityZone'),
-                            'MultiAZ': db.get('MultiAZ'),
-                            'StorageType': db.get('StorageType'),
-                            'InstanceCreateTime': self.format_datetime(
-                                self.convert_utc_to_kst(db.get('InstanceCreateTime'))
-                            ),
-                            'Tags': {tag['Key']: tag['Value'] for tag in db.get('TagList', [])}
-                        }
-                        instances.append(instance_data)
-
-                logger.debug(f"Found {len(instances)} instances in region {region}")
+                # DescribeDBInstances 최대 페이지 크기(100)로 요청 횟수 최소화
+                async for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+                    rows = [
+                        self._build_instance_data(account_id, region, db)
+                        for db in page['DBInstances']
+                    ]
+                    if rows:
+                        count += len(rows)
+                        yield rows
+
+                logger.debug(f"Found {count} instances in region {region}")
 
             except ClientError as e:
                 logger.error(f"Error fetching RDS instances in account {account_id}, region {region}: {e}")
-                continue
 
-        logger.info(f"Total {len(instances)} instances found in account {account_id}")
-        return instances
-
-    async def save_to_mongodb(self, instances: List[dict], account_id: str) -> None:
-        """MongoDB에 인스턴스 정보 저장"""
-        client = AsyncIOMotorClient(self.mongodb_uri)
-        db = client[self.mongodb_db_name]
-        collection = db[self.collection_name]
-
-        data = {
-            'timestamp': self.get_kst_time(),
+    @staticmethod
+    def _build_instance_data(account_id: str, region: str, db: dict) -> RDSInstanceRow:
+        """DescribeDBInstances 응답 항목을 저장용 인스턴스 정보로 변환"""
+        endpoint = db.get('Endpoint')
+        tags = db.get('TagList')
+        # 단순 필드는 키 튜플 기반으로 한 번에 추출
+        # (InstanceCreateTime은 boto3가 반환한 UTC datetime을 그대로 BSON Date로 저장)
+        fields = dict(zip(_INSTANCE_FIELDS, map(db.get, _INSTANCE_SOURCE_KEYS)))
+        return RDSInstanceRow(
+            account_id=account_id,
+            region=region,
+            endpoint={
+                'Address': endpoint.get('Address'),
+                'Port': endpoint.get('Port')
+            } if endpoint else None,
+            tags={tag['Key']: tag['Value'] for tag in tags} if tags else None,
+            **fields
+        )
+
+    def build_document(self, instances: List[RDSInstanceRow], account_id: str) -> dict:
+        """계정별 인스턴스 정보 저장 도큐먼트 생성"""
+        return {
+            'timestamp': self._run_ts or self.get_kst_time(),
             'account_id': account_id,
             'total_instances': len(instances),
-            'instances': instances
+            'instances': [instance.to_document() for instance in instances]
         }
 
+    async def _get_collection(self):
+        """저장 대상 컬렉션 반환 (MongoDB 클라이언트는 최초 호출 시 생성 후 재사용)"""
+        if self._mongo_client is None:
+            self._mongo_client = AsyncIOMotorClient(
+                self.mongodb_uri,
+                maxPoolSize=10,
+                minPoolSize=1,
+                serverSelectionTimeoutMS=5000
+            )
+            collection = self._mongo_client[self.mongodb_db_name][self.collection_name]
+
+            # 계정 + 수집 시각 조회용 복합 인덱스 (이미 존재하면 무시됨)
+            await collection.create_index(
+                [('account_id', ASCENDING), ('timestamp', DESCENDING)],
+                name='idx_account_timestamp',
+                background=True
+            )
+            return collection
+
+        return self._mongo_client[self.mongodb_db_name][self.collection_name]
+
+    async def close(self) -> None:
+        """MongoDB 클라이언트 종료"""
+        if self._mongo_client is not None:
+            self._mongo_client.close()
+            self._mongo_client = None
+
+    async def save_to_mongodb(self, documents: List[dict]) -> None:
+        """MongoDB에 계정별 인스턴스 정보 일괄 저장"""
+        collection = await self._get_collection()
+
+        # 계정별 도큐먼트를 한 번의 bulk 요청으로 저장 (개별 실패는 나머지 저장에 영향 없음)
+        operations = [InsertOne(document) for document in documents]
+        failed_indexes = set()
+
         try:
-            await collection.insert_one(data)
-            logger.info(f"Saved {len(instances)} RDS instances for account {account_id}")
+            # 수집기에서 생성한 도큐먼트이므로 스키마 검증 생략
+            await collection.bulk_write(
+                operations,
+                ordered=False,
+                bypass_document_validation=True
+            )
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                failed_indexes.add(error['index'])
+                logger.error(
+                    f"Failed to save RDS instances for account "
+                    f"{documents[error['index']]['account_id']}: {error.get('errmsg')}"
+                )
         except Exception as e:
-            logger.error(f"Error saving to MongoDB for account {account_id}: {e}")
-        finally:
-            client.close()
+            logger.error(f"Error saving to MongoDB for {len(documents)} accounts: {e}")
+            return
+
+        for index, document in enumerate(documents):
+            if index not in failed_indexes:
+                logger.info(
+                    f"Saved {document['total_instances']} RDS instances "
+                    f"for account {document['account_id']}"
+                )
+
+    async def _queue_document(self, instances: List[RDSInstanceRow], account_id: str) -> None:
+        """계정 도큐먼트를 저장 대기 목록에 추가하고, 대기 인스턴스 수가 배치 크기에 도달하면 저장"""
+        self._pending_documents.append(self.build_document(instances, account_id))
+        self._pending_instances += len(instances)
+        if self._pending_instances >= self.INSERT_BATCH_SIZE:
+            await self._flush_documents()
+
+    async def _flush_documents(self) -> None:
+        """저장 대기 중인 계정 도큐먼트를 한 번의 bulk 요청으로 저장"""
+        if not self._pending_documents:
+            return
+
+        # 저장 중 다른 계정이 추가하는 도큐먼트는 다음 배치로 넘어가도록 목록을 먼저 교체
+        documents, self._pending_documents = self._pending_documents, []
+        self._pending_instances = 0
+        await self.save_to_mongodb(documents)
 
     async def run(self, env: str = 'prd') -> None:
         """RDS 인스턴스 수집 실행"""
@@ -162,45 +329,21 @@ class RDSInstanceCollector:
 
             logger.info(f"Starting RDS instance collection for {len(accounts)} accounts")
 
+            # 동일 실행에서 저장되는 모든 계정 도큐먼트가 같은 수집 시각을 갖도록 한 번만 계산
+            self._run_ts = self.get_kst_time()
+
             # 환경에 따른 세션 초기화
-            if self.session_manager.environment == EnvironmentType.LOCAL:
-                # 로컬 환경에서는 각 계정별로 SSO 세션 생성
-                for account in accounts:
-                    try:
-                        session = self.session_manager._get_sso_session(account.aws_account_id)
-                        self.session_manager._sessions[account.aws_account_id] = session
-                    except Exception as e:
-                        logger.error(f"Failed to create SSO session for account {account.aws_account_id}: {e}")
-                        continue
-            else:
-                # EC2/EKS 환경에서는 각 계정별로 Role 세션 생성
-                for account in accounts:
-                    try:
-                        session = self.session_manager._get_role_session(account.aws_account_id)
-                        self.session_manager._sessions[account.aws_account_id] = session
-                    except Exception as e:
-                        logger.error(f"Failed to create role session for account {account.aws_account_id}: {e}")
-                        continue
-
-            # 각 계정별로 RDS 인스턴스 수집
-            for account in accounts:
-                try:
-                    logger.info(
-                        f"Processing account {account.aws_account_id} "
-                        f"({account.aws_account_name}) "
-                        f"in regions: {', '.join(account.regions)}"
-                    )
+            # (로컬 환경은 SSO 세션, EC2/EKS 환경은 Role 세션)
+            await self._create_sessions(accounts)
 
-                    instances = await self.get_rds_instances(account)
-                    if instances:
-                        await self.save_to_mongodb(instances, account.aws_account_id)
-                        logger.info(f"Successfully processed account {account.aws_account_id}")
-                    else:
-                        logger.warning(f"No RDS instances found for account {account.aws_account_id}")
+            # 계정별 RDS 인스턴스 병렬 수집 및 저장 (계정별 오류는 _process_account에서 처리)
+            await asyncio.gather(
+                *(self._process_account(account) for account in accounts),
+                return_exceptions=True
+            )
 
-                except Exception as e:
-                    logger.exception(f"Error processing account {account.aws_account_id}: {str(e)}")
-                    continue
+            # 배치 크기에 도달하지 않은 나머지 도큐먼트 저장
+            await self._flush_documents()
 
             logger.info("RDS instance collection completed successfully")
 
@@ -208,13 +351,87 @@ class RDSInstanceCollector:
             logger.exception(f"Failed to run RDS instance collection: {str(e)}")
             raise
 
+        finally:
+            await self.session_manager.close_async_clients()
+
+
+    async def _create_sessions(self, accounts: List[AWSAccountInDB]) -> None:
+        """계정별 AWS 세션을 스레드 풀에서 병렬 생성"""
+        if self.session_manager.environment == EnvironmentType.LOCAL:
+            create_session = self.session_manager._get_sso_session
+            session_type = 'SSO'
+        else:
+            create_session = self.session_manager._get_role_session
+            session_type = 'role'
+
+        # 세션 생성(STS 호출)은 블로킹이므로 스레드 풀에서 동시에 실행
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=min(16, len(accounts))) as pool:
+            sessions = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, create_session, account.aws_account_id)
+                    for account in accounts
+                ),
+                return_exceptions=True
+            )
+
+        for account, session in zip(accounts, sessions):
+            if isinstance(session, Exception):
+                logger.error(
+                    f"Failed to create {session_type} session for account {account.aws_account_id}: {session}"
+                )
+                continue
+            self.session_manager.set_session(account.aws_account_id, session)
+
+    async def _process_account(self, account: AWSAccountInDB) -> int:
+        """계정별 RDS 인스턴스 수집 및 저장
+
+        조회된 페이지를 INSERT_BATCH_SIZE 단위 도큐먼트로 모아 계정 간 공용 저장 대기 목록에 넘겨
+        계정 규모와 관계없이 메모리 사용량을 일정하게 유지하면서 여러 계정을 한 번의 요청으로 저장합니다.
+
+        Returns:
+            수집된 인스턴스 수
+        """
+        account_id = account.aws_account_id
+        total = 0
+        batch: List[RDSInstanceRow] = []
+
+        try:
+            logger.info(
+                f"Processing account {account_id} "
+                f"({account.aws_account_name}) "
+                f"in regions: {', '.join(account.regions)}"
+            )
+
+            async for rows in self.iter_rds_instances(account):
+                total += len(rows)
+                batch.extend(rows)
+                while len(batch) >= self.INSERT_BATCH_SIZE:
+                    await self._queue_document(batch[:self.INSERT_BATCH_SIZE], account_id)
+                    del batch[:self.INSERT_BATCH_SIZE]
+
+            if batch:
+                await self._queue_document(batch, account_id)
+
+            if total:
+                logger.info(f"Successfully processed account {account_id} ({total} instances)")
+            else:
+                logger.warning(f"No RDS instances found for account {account_id}")
+
+        except Exception as e:
+            logger.exception(f"Error processing account {account_id}: {str(e)}")
+
+        return total
+
 
 async def main():
     collector = RDSInstanceCollector()
-    await collector.run()
+    try:
+        await collector.run()
+    finally:
+        await collector.close()
 
 
 if __name__ == '__main__':
-    import asyncio
-
+    logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
     asyncio.run(main())
\ No newline at end of file
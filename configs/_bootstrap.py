@@ -0,0 +1,10 @@
+# configs/_bootstrap.py
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache()
+def load_env() -> bool:
+    """.env 파일 로드 (프로세스당 최초 1회만 수행)"""
+    return load_dotenv()
+
@@ -1,5 +1,6 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Tuple
 
 
 class CloudWatchSettings(BaseSettings):
@@ -41,10 +42,10 @@ class CloudWatchSettings(BaseSettings):
         "ReplicalLag",  # 복제 지연 시간
     ]
 
-    @property
-    def METRICS(self) -> List[str]:
-        """모든 수집 대상 메트릭 반환"""
-        return self.COMMON_METRICS + self.AURORA_METRICS
+    @cached_property
+    def METRICS(self) -> Tuple[str, ...]:
+        """모든 수집 대상 메트릭 반환 (최초 접근 시 한 번만 생성)"""
+        return tuple(self.COMMON_METRICS + self.AURORA_METRICS)
 
     class Config:
         env_file = ".env"
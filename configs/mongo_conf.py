@@ -1,10 +1,11 @@
 # mongo_conf.py
 import os
-from dotenv import load_dotenv
+from configs._bootstrap import load_env
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from motor.motor_asyncio import AsyncIOMotorClient
 
-load_dotenv()
+load_env()
 
 
 class MongoSettings(BaseSettings):
@@ -51,6 +52,19 @@ def get_mongo_settings():
     return MongoSettings()
 
 
+@lru_cache()
+def get_mongo_client() -> AsyncIOMotorClient:
+    """프로세스 공용 MongoDB 클라이언트 반환 (연결 풀/모니터링 스레드 공유)"""
+    return AsyncIOMotorClient(get_mongo_settings().MONGODB_URI)
+
+
+def close_mongo_client() -> None:
+    """공용 MongoDB 클라이언트 종료 (생성된 경우에만)"""
+    if get_mongo_client.cache_info().currsize:
+        get_mongo_client().close()
+        get_mongo_client.cache_clear()
+
+
 mongo_settings = get_mongo_settings()
 MONGODB_URI = mongo_settings.MONGODB_URI
 MONGODB_DB_NAME = mongo_settings.MONGODB_DB_NAME
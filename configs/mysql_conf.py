@@ -1,28 +1,28 @@
-import os
 from pydantic_settings import BaseSettings
-from functools import lru_cache
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+from configs._bootstrap import load_env
 
-load_dotenv()
+load_env()
 
 
 class MySQLSettings(BaseSettings):
-    # MySQL 기본 연결 설정
-    MYSQL_CONNECTION_TIMEOUT: int = int(os.getenv("MYSQL_CONNECTION_TIMEOUT", "10"))
-    MYSQL_MAX_POOL_SIZE: int = int(os.getenv("MYSQL_MAX_POOL_SIZE", "2"))
-    MYSQL_MIN_POOL_SIZE: int = int(os.getenv("MYSQL_MIN_POOL_SIZE", "1"))
-    MYSQL_POOL_RECYCLE: int = int(os.getenv("MYSQL_POOL_RECYCLE", "3600"))
-    MYSQL_QUERY_TIMEOUT: int = int(os.getenv("MYSQL_QUERY_TIMEOUT", "60"))
-
-    @property
+    # MySQL 기본 연결 설정 (환경변수 값은 BaseSettings가 설정 생성 시 타입 변환하여 적용)
+    MYSQL_CONNECTION_TIMEOUT: int = 10
+    MYSQL_MAX_POOL_SIZE: int = 2
+    MYSQL_MIN_POOL_SIZE: int = 1
+    MYSQL_POOL_RECYCLE: int = 3600
+    MYSQL_QUERY_TIMEOUT: int = 60
+    MYSQL_ECHO: bool = False  # 실행 쿼리 로깅 (디버깅용)
+
+    @cached_property
     def default_connection_args(self) -> dict:
-        """기본 MySQL 연결 설정 반환"""
+        """기본 MySQL 연결 설정 반환 (최초 접근 시 한 번만 생성, 호출 측에서 수정하지 않음)"""
         return {
             'connect_timeout': self.MYSQL_CONNECTION_TIMEOUT,
             'maxsize': self.MYSQL_MAX_POOL_SIZE,
             'minsize': self.MYSQL_MIN_POOL_SIZE,
             'pool_recycle': self.MYSQL_POOL_RECYCLE,
-            'echo': True,
+            'echo': self.MYSQL_ECHO,
             'charset': 'utf8mb4'
         }
 
@@ -1,63 +1,76 @@
 # configs/report_settings.py
 import os
-import json
 import logging
-from typing import List
-from dotenv import load_dotenv
+import orjson
+from functools import lru_cache
+from typing import FrozenSet, Tuple
+from configs._bootstrap import load_env
 
 logger = logging.getLogger(__name__)
 
 # .env 파일 로드
-load_dotenv()
+load_env()
 
 
 class ReportSettings:
     """리포트 생성 관련 설정"""
 
     @staticmethod
-    def get_report_target_instances() -> List[str]:
+    @lru_cache(maxsize=1)
+    def get_report_target_instances() -> Tuple[str, ...]:
         """월간 리포트에 포함할 분석 대상 인스턴스 목록 반환
 
         Returns:
-            List[str]: 분석 대상 인스턴스 목록. 설정이 없거나 유효하지 않은 경우 빈 리스트 반환.
+            Tuple[str, ...]: 분석 대상 인스턴스 목록. 설정이 없거나 유효하지 않은 경우 빈 튜플 반환.
 
         Note:
             - 리포트에는 전체 인스턴스 통계가 포함되지만,
             - 여기서 지정된 인스턴스들은 상세 메트릭 분석 및 그래프가 추가됨
+            - 환경변수는 실행 중 변하지 않으므로 최초 호출 결과를 캐시하여 재사용
         """
         try:
             # .env에서 JSON 배열 형식의 문자열 가져오기
             instances_json = os.getenv('REPORT_TARGET_INSTANCES')
 
-            # 환경변수가 없는 경우 빈 리스트 반환
+            # 환경변수가 없는 경우 빈 튜플 반환
             if not instances_json:
                 logger.info("REPORT_TARGET_INSTANCES not set. No instances will be analyzed in detail.")
-                return []
+                return ()
 
             # JSON 파싱
-            instances = json.loads(instances_json)
+            instances = orjson.loads(instances_json)
 
             # 타입 체크
             if not isinstance(instances, list):
                 logger.warning("REPORT_TARGET_INSTANCES must be a JSON array")
-                return []
+                return ()
 
             # 유효한 인스턴스 이름만 필터링
-            valid_instances = [
+            valid_instances = tuple(
                 inst.strip()
                 for inst in instances
                 if isinstance(inst, str) and inst.strip()
-            ]
+            )
 
             if not valid_instances:
                 logger.info("No valid instances found in REPORT_TARGET_INSTANCES")
-                return []
+                return ()
 
             return valid_instances
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse REPORT_TARGET_INSTANCES: {e}")
-            return []
+            return ()
         except Exception as e:
             logger.error(f"Error in get_report_target_instances: {e}")
-            return []
\ No newline at end of file
+            return ()
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_report_target_instance_set() -> FrozenSet[str]:
+        """분석 대상 인스턴스 집합 반환 (인스턴스별 대상 여부 확인용)
+
+        Returns:
+            FrozenSet[str]: get_report_target_instances()와 동일한 인스턴스의 집합
+        """
+        return frozenset(ReportSettings.get_report_target_instances())
\ No newline at end of file
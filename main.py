@@ -5,7 +5,12 @@ import sys
 import importlib
 from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from configs.mongo_conf import close_mongo_client
+from modules.ai.factory import AIModelFactory
+from modules.collection_pools import start_process_pools, shutdown_process_pools, shutdown_analysis_pool
+from modules.router_registry import discover_routers, register_routers
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 project_root = str(Path(__file__).parent)
@@ -39,51 +44,14 @@ def auto_register_routers(app: FastAPI, apis_dir: str = "apis") -> None:
             logger.warning(f"APIs 디렉토리를 찾을 수 없습니다: {apis_path}")
             return
 
-        # apis 디렉토리 내의 모든 Python 파일 검색
-        for python_file in apis_path.glob("**/*.py"):
-            if python_file.name.startswith("_"):
-                continue
-
-            # 파일 경로를 모듈 경로로 변환
-            module_path = str(python_file.relative_to(current_dir))[:-3].replace("/", ".").replace("\\", ".")
-
-            try:
-                # 모듈 동적 로드
-                module = importlib.import_module(module_path)
-
-                # 모듈에서 라우터 찾기
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, APIRouter):
-                        # 라우터의 태그 설정
-                        module_name = python_file.stem
-                        if not attr.tags:
-                            attr.tags = [module_name]
-
-                        # 기존 prefix 제거 (만약 있다면)
-                        if hasattr(attr, "prefix"):
-                            original_prefix = attr.prefix
-                            attr.prefix = ""  # 기존 prefix 제거
-                        else:
-                            original_prefix = ""
-
-                        # 파일 경로에서 버전 정보 추출 (v1, v2 등)
-                        relative_path = python_file.relative_to(apis_path)
-                        version = relative_path.parts[0] if len(relative_path.parts) > 1 else ""
-
-                        # 새로운 prefix 설정
-                        if version:
-                            new_prefix = f"/api/{version}{original_prefix}"
-                        else:
-                            new_prefix = f"/api{original_prefix}"
-
-                        # 라우터 등록
-                        app.include_router(attr, prefix=new_prefix)
-                        logger.info(f"라우터 등록 완료: {module_name} ({new_prefix})")
-
-            except Exception as e:
-                logger.error(f"라우터 로드 중 오류 발생 ({module_path}): {str(e)}")
-                logger.exception(e)
+        # 빌드 시 생성된 매니페스트가 있으면 디렉토리 탐색 없이 등록
+        # (scripts/generate_router_manifest.py 로 생성, 없으면 기동 시 탐색)
+        try:
+            entries = importlib.import_module(f"{apis_dir}._manifest").ROUTERS
+        except ModuleNotFoundError:
+            entries = discover_routers(apis_path, apis_dir)
+
+        register_routers(app, entries)
 
     except Exception as e:
         logger.error(f"라우터 자동 등록 중 오류 발생: {str(e)}")
@@ -96,9 +64,14 @@ async def lifespan(app: FastAPI):
     FastAPI 애플리케이션 라이프사이클 관리
     """
     # 시작 시 실행
+    start_process_pools()
     logger.info("RDS Report Service가 시작되었습니다.")
     yield
     # 종료 시 실행
+    shutdown_process_pools()
+    shutdown_analysis_pool()
+    await AIModelFactory.close_all()
+    close_mongo_client()
     logger.info("RDS Report Service가 종료됩니다.")
 
 
@@ -110,6 +83,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,  # 대용량 메트릭 응답 직렬화 속도 개선
     lifespan=lifespan  # 라이프사이클 이벤트 핸들러 등록
 )
 
@@ -1,9 +1,9 @@
 # models/aws_account.py
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict
 from enum import Enum
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class EnvironmentType(str, Enum):
     PRD = "prd"
@@ -12,19 +12,27 @@ class EnvironmentType(str, Enum):
 
 class AWSAccountBase(BaseModel):
     """AWS 계정 등록을 위한 기본 모델"""
-    aws_account_id: constr(min_length=12, max_length=12, pattern=r"^\d+$")
+    aws_account_id: str
     aws_account_name: str = Field(..., min_length=1)
     regions: List[str] = Field(..., min_items=1)
     environment_type: EnvironmentType = Field(..., description="계정의 환경 타입 (prd/dev/both)")
     description: str | None = None
 
+    @field_validator("aws_account_id")
+    @classmethod
+    def validate_aws_account_id(cls, value: str) -> str:
+        """AWS 계정 ID 형식 검증 (12자리 숫자, 정규식 대신 문자열 메서드 사용)"""
+        if len(value) != 12 or not value.isascii() or not value.isdigit():
+            raise ValueError("aws_account_id must be a 12-digit number")
+        return value
+
 class AWSAccountCreate(AWSAccountBase):
     pass
 
 class AWSAccountInDB(AWSAccountBase):
     """MongoDB에 저장되는 AWS 계정 모델"""
-    create_at: datetime = Field(default_factory=datetime.utcnow)
-    update_at: datetime = Field(default_factory=datetime.utcnow)
+    create_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    update_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Config:
         json_encoders = {
@@ -41,4 +49,6 @@ class AWSAccountUpdate(BaseModel):
 class AWSAccountResponse(AWSAccountBase):
     """API 응답을 위한 모델"""
     create_at: datetime
-    update_at: datetime
\ No newline at end of file
+    update_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -7,7 +7,7 @@ from bson import ObjectId
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SlowQueryInfo:
     """슬로우 쿼리 정보"""
     _id: ObjectId
@@ -1,33 +1,56 @@
 # modules/ai/factory.py
-from typing import Dict, Type
+import importlib
+from functools import lru_cache
+from typing import Dict, Tuple, Type
 from modules.ai.models.interface import AIModel
-from modules.ai.models.ollama import OllamaModel
-from modules.ai.models.bedrock import BedrockModel
-from modules.ai.models.openai import OpenAIModel
-from modules.ai.models.claude import ClaudeModel
 from modules.ai.exceptions import ModelNotFoundError
 
 
 class AIModelFactory:
     """AI 모델 생성을 위한 팩토리 클래스"""
 
-    _models: Dict[str, Type[AIModel]] = {
-        "ollama": OllamaModel,
-        "bedrock": BedrockModel,
-        "openai": OpenAIModel,
-        "claude": ClaudeModel
+    # 모델 타입별 (모듈 경로, 클래스명) - SDK 임포트는 실제 사용 시점까지 지연
+    _models: Dict[str, Tuple[str, str]] = {
+        "ollama": ("modules.ai.models.ollama", "OllamaModel"),
+        "bedrock": ("modules.ai.models.bedrock", "BedrockModel"),
+        "openai": ("modules.ai.models.openai", "OpenAIModel"),
+        "claude": ("modules.ai.models.claude", "ClaudeModel")
     }
 
+    # 모델 타입별 공유 인스턴스 (클라이언트 초기화는 인스턴스당 1회)
+    _instances: Dict[str, AIModel] = {}
+
     @classmethod
     def get_model(cls, model_type: str) -> AIModel:
-        """지정된 타입의 AI 모델 인스턴스 반환"""
-        model_class = cls._models.get(model_type.lower())
-        if not model_class:
+        """지정된 타입의 AI 모델 인스턴스 반환 (타입별 싱글톤)"""
+        key = model_type.lower()
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        model_path = cls._models.get(key)
+        if not model_path:
             raise ModelNotFoundError(f"모델 타입 '{model_type}'를 찾을 수 없습니다")
 
-        return model_class()
+        model_class = _load_model_class(*model_path)
+        return cls._instances.setdefault(key, model_class())
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """생성된 모델 인스턴스의 연결 자원 정리 (애플리케이션 종료 시 호출)"""
+        for instance in cls._instances.values():
+            aclose = getattr(instance, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        cls._instances.clear()
 
     @classmethod
     def available_models(cls) -> list[str]:
         """사용 가능한 모델 타입 목록 반환"""
-        return list(cls._models.keys())
\ No newline at end of file
+        return list(cls._models.keys())
+
+
+@lru_cache(maxsize=None)
+def _load_model_class(module_path: str, class_name: str) -> Type[AIModel]:
+    """모델 클래스가 정의된 모듈을 임포트하여 클래스 반환"""
+    return getattr(importlib.import_module(module_path), class_name)
@@ -1,9 +1,9 @@
 # ai/models/bedrock.py
 import boto3
-import json
+import orjson
 from typing import Optional
 from modules.ai.models.interface import AIModel
-from modules.ai.exceptions import AIModuleException
+from modules.ai.exceptions import AIModuleException, APIKeyNotFoundError
 from configs.ai_conf import get_ai_config
 
 
@@ -28,7 +28,7 @@ class BedrockModel(AIModel):
             await self.initialize()
 
         try:
-            body = json.dumps({
+            body = orjson.dumps({
                 "prompt": prompt,
                 "max_tokens_to_sample": kwargs.get("max_tokens", self.config.CLAUDE_MAX_TOKENS),
                 "temperature": kwargs.get("temperature", 0.3),
@@ -39,14 +39,19 @@ class BedrockModel(AIModel):
                 body=body
             )
 
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
             return response_body['completion']
         except Exception as e:
             raise AIModuleException(f"Bedrock 오류: {str(e)}")
 
     async def is_available(self) -> bool:
+        # 자격 증명이 없으면 클라이언트를 생성하지 않고 바로 판단
+        if not (self.config.AWS_ACCESS_KEY_ID and self.config.AWS_SECRET_ACCESS_KEY):
+            return False
         try:
-            await self.initialize()
+            if not self.client:
+                await self.initialize()
             return True
-        except:
+        except Exception:
+            # 리전 미설정/엔드포인트 오류 등 클라이언트 생성 실패도 사용 불가로 판단
             return False
\ No newline at end of file
@@ -2,7 +2,7 @@
 from anthropic import AsyncAnthropic
 from typing import Optional
 from modules.ai.models.interface import AIModel
-from modules.ai.exceptions import AIModuleException
+from modules.ai.exceptions import AIModuleException, APIKeyNotFoundError
 from configs.ai_conf import get_ai_config
 
 
@@ -32,8 +32,11 @@ class ClaudeModel(AIModel):
             raise AIModuleException(f"Claude 오류: {str(e)}")
 
     async def is_available(self) -> bool:
+        if not self.config.ANTHROPIC_API_KEY:
+            return False
         try:
-            await self.initialize()
+            if not self.client:
+                await self.initialize()
             return True
-        except:
+        except Exception:
             return False
\ No newline at end of file
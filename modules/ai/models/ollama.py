@@ -1,3 +1,4 @@
+import time
 import aiohttp
 from typing import Optional
 from modules.ai.models.interface import AIModel
@@ -6,34 +7,58 @@ from configs.ai_conf import get_ai_config
 
 
 class OllamaModel(AIModel):
+    AVAILABILITY_TTL = 30  # /version 확인 결과 재사용 시간 (초)
+
     def __init__(self) -> None:
         self.config = get_ai_config()
         self.base_url = self.config.OLLAMA_BASE_URL
         self.model_name = self.config.OLLAMA_MODEL_NAME
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._available: Optional[bool] = None
+        self._available_checked_at = 0.0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """요청 간 공유하는 HTTP 세션 반환 (연결 재사용)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
 
     async def initialize(self) -> None:
         if not await self.is_available():
             raise AIModuleException("Ollama 서비스를 사용할 수 없습니다.")
 
     async def generate_text(self, prompt: str, **kwargs) -> str:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                    f"{self.base_url}/generate",
-                    json={
-                        "model": self.model_name,
-                        "prompt": prompt,
-                        "options": kwargs
-                    }
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get("response", "")
-                raise AIModuleException(f"Ollama 오류: {await response.text()}")
+        async with self._get_session().post(
+                f"{self.base_url}/generate",
+                json={
+                    "model": self.model_name,
+                    "prompt": prompt,
+                    "options": kwargs
+                }
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                return result.get("response", "")
+            raise AIModuleException(f"Ollama 오류: {await response.text()}")
 
     async def is_available(self) -> bool:
+        # 반복 확인 시 서버 부하를 줄이기 위해 최근 확인 결과 재사용
+        now = time.monotonic()
+        if self._available is not None and now - self._available_checked_at < self.AVAILABILITY_TTL:
+            return self._available
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/version") as response:
-                    return response.status == 200
-        except:
-            return False
\ No newline at end of file
+            async with self._get_session().get(f"{self.base_url}/version") as response:
+                available = response.status == 200
+        except Exception:
+            available = False
+
+        self._available = available
+        self._available_checked_at = now
+        return available
+
+    async def aclose(self) -> None:
+        """공유 HTTP 세션 종료"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
\ No newline at end of file
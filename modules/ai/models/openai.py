@@ -2,7 +2,7 @@
 from openai import AsyncOpenAI
 from typing import Optional
 from modules.ai.models.interface import AIModel
-from modules.ai.exceptions import AIModuleException
+from modules.ai.exceptions import AIModuleException, APIKeyNotFoundError
 from configs.ai_conf import get_ai_config
 
 
@@ -33,8 +33,11 @@ class OpenAIModel(AIModel):
             raise AIModuleException(f"OpenAI 오류: {str(e)}")
 
     async def is_available(self) -> bool:
+        if not self.config.OPENAI_API_KEY:
+            return False
         try:
-            await self.initialize()
+            if not self.client:
+                await self.initialize()
             return True
-        except:
+        except Exception:
             return False
\ No newline at end of file
@@ -1,78 +1,109 @@
 # modules/aws_account_module.py
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, ReturnDocument
 from models.aws_account import (
     AWSAccountCreate,
     AWSAccountInDB,
     AWSAccountUpdate,
     EnvironmentType
 )
-from configs.mongo_conf import mongo_settings
+from configs.mongo_conf import mongo_settings, get_mongo_client
 
 logger = logging.getLogger(__name__)
 
+# 조회 시 제외할 필드 (모델에 없는 _id는 전송하지 않음)
+_ACCOUNT_PROJECTION = {"_id": 0}
+
 
 class AWSAccountModule:
     """AWS 계정 정보 관리 모듈"""
 
     def __init__(self):
-        self.client = AsyncIOMotorClient(mongo_settings.MONGODB_URI)
+        self.client = get_mongo_client()
         self.db = self.client[mongo_settings.MONGODB_DB_NAME]
         self.collection = self.db[mongo_settings.MONGO_AWS_ACCOUNT_COLLECTION]
+        self._indexes_ready = False
+
+    async def _get_collection(self):
+        """계정 컬렉션 반환 (최초 호출 시 조회용 인덱스 생성)"""
+        if not self._indexes_ready:
+            try:
+                await self.collection.create_index(
+                    [("aws_account_id", ASCENDING)], name="idx_aws_account_id", unique=True
+                )
+                await self.collection.create_index(
+                    [("environment_type", ASCENDING)], name="idx_environment_type"
+                )
+            except Exception as e:
+                # 인덱스 생성 실패 시에도 조회는 가능하므로 경고만 남김
+                logger.warning(f"Failed to create AWS account indexes: {e}")
+            self._indexes_ready = True
+        return self.collection
 
     async def create_account(self, account: AWSAccountCreate) -> AWSAccountInDB:
         """새로운 AWS 계정 정보 생성"""
+        collection = await self._get_collection()
+
         # 중복 계정 확인
-        existing = await self.collection.find_one({"aws_account_id": account.aws_account_id})
+        existing = await collection.find_one(
+            {"aws_account_id": account.aws_account_id}, _ACCOUNT_PROJECTION
+        )
         if existing:
             raise ValueError(f"Account with ID {account.aws_account_id} already exists")
 
         account_in_db = AWSAccountInDB(
-            **account.dict()
+            **account.model_dump()
         )
 
-        await self.collection.insert_one(account_in_db.dict())
+        # BSON으로 바로 인코딩 가능한 파이썬 객체로 변환 (None 필드는 저장하지 않음)
+        await collection.insert_one(account_in_db.model_dump(mode="python", exclude_none=True))
         return account_in_db
 
     async def get_account(self, account_id: str) -> Optional[AWSAccountInDB]:
         """특정 AWS 계정 정보 조회"""
-        account_data = await self.collection.find_one({"aws_account_id": account_id})
+        collection = await self._get_collection()
+        account_data = await collection.find_one({"aws_account_id": account_id}, _ACCOUNT_PROJECTION)
         if account_data:
             return AWSAccountInDB(**account_data)
         return None
 
     async def get_all_accounts(self) -> List[AWSAccountInDB]:
         """모든 AWS 계정 정보 조회"""
-        accounts = []
-        async for account in self.collection.find():
-            accounts.append(AWSAccountInDB(**account))
-        return accounts
+        # 저장 시 검증된 도큐먼트이므로 재검증 없이 모델 생성
+        collection = await self._get_collection()
+        documents = await collection.find({}, _ACCOUNT_PROJECTION).to_list(length=None)
+        return [AWSAccountInDB.model_construct(**document) for document in documents]
 
     async def update_account(
             self, account_id: str, account_update: AWSAccountUpdate
     ) -> Optional[AWSAccountInDB]:
         """AWS 계정 정보 업데이트"""
-        update_data = account_update.dict(exclude_unset=True)
+        update_data = account_update.model_dump(exclude_unset=True)
         if not update_data:
             return await self.get_account(account_id)
 
-        update_data["update_at"] = datetime.utcnow()
+        update_data["update_at"] = datetime.now(timezone.utc)
 
-        result = await self.collection.update_one(
+        # 갱신과 갱신 후 도큐먼트 조회를 한 번의 요청으로 처리
+        collection = await self._get_collection()
+        account_data = await collection.find_one_and_update(
             {"aws_account_id": account_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection=_ACCOUNT_PROJECTION,
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.modified_count:
-            return await self.get_account(account_id)
+        if account_data:
+            return AWSAccountInDB.model_construct(**account_data)
         return None
 
     async def delete_account(self, account_id: str) -> bool:
         """AWS 계정 정보 삭제"""
-        result = await self.collection.delete_one({"aws_account_id": account_id})
+        collection = await self._get_collection()
+        result = await collection.delete_one({"aws_account_id": account_id})
         return result.deleted_count > 0
 
     async def get_accounts_by_environment(self, env: EnvironmentType) -> List[AWSAccountInDB]:
@@ -91,7 +122,11 @@ class AWSAccountModule:
             ]
         }
 
-        accounts = []
-        async for account in self.collection.find(query):
-            accounts.append(AWSAccountInDB(**account))
-        return sorted(accounts, key=lambda x: x.aws_account_name)
\ No newline at end of file
+        # 정렬은 MongoDB에서 수행하고, 저장 시 검증된 도큐먼트이므로 재검증 없이 모델 생성
+        collection = await self._get_collection()
+        documents = await (
+            collection.find(query, _ACCOUNT_PROJECTION)
+            .sort("aws_account_name", 1)
+            .to_list(length=None)
+        )
+        return [AWSAccountInDB.model_construct(**document) for document in documents]
\ No newline at end of file
@@ -2,21 +2,51 @@
 
 import boto3
 import os
-import json
+import asyncio
+import socket
 import subprocess
+import threading
 import pytz
 import botocore.config
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+from aiobotocore.config import AioConfig
+from aiobotocore.credentials import AioRefreshableCredentials
+from aiobotocore.session import AioSession
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, List, Literal, Mapping, Tuple
+from contextlib import AsyncExitStack
 from enum import Enum
 import logging
+import orjson
 from pathlib import Path
+from types import MappingProxyType
 import configparser
 from modules.instance_fetcher import InstanceFetcher, InstanceQueryResult, AccountInfo
 
 logger = logging.getLogger(__name__)
 
+# SSO 로그인(aws sso login) 동시 실행 방지용 잠금
+_SSO_LOGIN_LOCK = threading.Lock()
+
+# 리전별 공용 STS 클라이언트 (AssumeRole 호출 간 연결 재사용)
+_sts_clients: Dict[str, Any] = {}
+_STS_CLIENT_LOCK = threading.Lock()
+
+# AWS SDK 클라이언트 공통 설정
+CLIENT_CONFIG_OPTIONS: Dict[str, Any] = dict(
+    max_pool_connections=50,  # 연결 풀 크기 (수집기 동시 처리 수의 2배 이상)
+    retries=dict(
+        mode='adaptive',  # 스로틀링 발생 시 요청 속도 자동 조절
+        max_attempts=5  # 재시도 횟수
+    ),
+    connect_timeout=5,  # 연결 타임아웃 (초)
+    read_timeout=60,  # 읽기 타임아웃 (초)
+    tcp_keepalive=True  # TCP 연결 유지
+)
+
 
 class EnvironmentType(Enum):
     LOCAL = "local"
@@ -32,6 +62,47 @@ class AWSSSOConfig:
     ROLE_NAME = "AdministratorAccess"
 
 
+# EC2 인스턴스 메타데이터 서비스 (IMDS) 주소 및 연결 확인 타임아웃 (초)
+IMDS_ADDRESS = ("169.254.169.254", 80)
+IMDS_PROBE_TIMEOUT = 0.1
+
+
+@lru_cache(maxsize=1)
+def _detect_environment_cached() -> EnvironmentType:
+    """실행 환경 감지 (프로세스당 1회만 수행)"""
+    if os.path.isdir("/var/run/secrets/kubernetes.io"):
+        return EnvironmentType.EKS
+    try:
+        # HTTP 요청 없이 메타데이터 서비스 포트 연결 여부만 확인
+        with socket.create_connection(IMDS_ADDRESS, timeout=IMDS_PROBE_TIMEOUT):
+            return EnvironmentType.EC2
+    except OSError:
+        return EnvironmentType.LOCAL
+
+
+@lru_cache(maxsize=None)
+def _load_aws_config(config_path: str, mtime: float, profile_name: str) -> Mapping[str, str]:
+    """
+    AWS config 파일의 프로파일 섹션 반환
+
+    파일 경로/수정 시각/프로파일 단위로 캐시되어 계정별 세션 생성 시 파일을 다시 읽지 않으며,
+    반환값은 캐시 공유를 위해 읽기 전용입니다.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+
+    # 프로파일 섹션 이름 결정
+    if profile_name == "default":
+        section_name = "default"
+    else:
+        section_name = f"profile {profile_name}"
+
+    if section_name not in config:
+        raise ValueError(f"Profile '{profile_name}' not found in AWS config")
+
+    return MappingProxyType(dict(config[section_name]))
+
+
 class AWSSSOLogin:
     """AWS SSO 로그인 처리 클래스"""
 
@@ -41,95 +112,65 @@ class AWSSSOLogin:
         self.cache_dir = Path.home() / '.aws' / 'sso' / 'cache'
         self._config = self._load_config()
 
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Mapping[str, str]:
         """AWS config 파일에서 SSO 설정을 읽어옵니다."""
-        config = configparser.ConfigParser()
         config_path = Path.home() / '.aws' / 'config'
 
         if not config_path.exists():
             raise FileNotFoundError("AWS config file not found")
 
-        config.read(config_path)
-
-        # 프로파일 섹션 이름 결정
-        if self.profile_name == "default":
-            section_name = "default"
-        else:
-            section_name = f"profile {self.profile_name}"
-
-        if section_name not in config:
-            raise ValueError(f"Profile '{self.profile_name}' not found in AWS config")
-
-        return dict(config[section_name])
+        return _load_aws_config(str(config_path), config_path.stat().st_mtime, self.profile_name)
 
-    def _get_cached_credentials(self) -> Optional[Dict[str, Any]]:
-        """SSO 캐시에서 자격 증명을 찾습니다."""
-        if not self.cache_dir.exists():
-            return None
-
-        try:
-            # 가장 최근의 캐시 파일 찾기
-            latest_cache = None
-            latest_time = datetime.min.replace(tzinfo=pytz.UTC)
-
-            for cache_file in self.cache_dir.glob('*.json'):
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
-                        if 'expiresAt' in cache_data:
+    def _ensure_sso_login(self) -> None:
+        """SSO 로그인 상태를 확인하고 필요한 경우 로그인을 수행합니다."""
+        # 여러 계정 세션을 동시에 초기화할 때 로그인 프로세스가 중복 실행되지 않도록 직렬화
+        with _SSO_LOGIN_LOCK:
+            try:
+                # 캐시된 자격 증명 확인 (최근 수정된 파일부터, 만료되지 않은 항목이 하나라도 있으면 종료)
+                if self.cache_dir.exists():
+                    now = datetime.now(pytz.UTC)
+                    try:
+                        cache_files = sorted(
+                            self.cache_dir.glob('*.json'),
+                            key=lambda path: path.stat().st_mtime,
+                            reverse=True
+                        )
+                    except OSError as e:
+                        logger.error(f"캐시 처리 중 오류 발생: {str(e)}")
+                        cache_files = []
+
+                    for cache_file in cache_files:
+                        try:
+                            cache_data = orjson.loads(cache_file.read_bytes())
                             # ISO 형식의 시간을 UTC 시간으로 파싱
                             expires_at = datetime.fromisoformat(
                                 cache_data['expiresAt'].replace('Z', '+00:00')
                             ).astimezone(pytz.UTC)
+                        except (orjson.JSONDecodeError, KeyError, ValueError, TypeError, OSError):
+                            continue
 
-                            if expires_at > latest_time:
-                                latest_time = expires_at
-                                latest_cache = cache_data
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
-
-            return latest_cache
-
-        except Exception as e:
-            logger.error(f"캐시 처리 중 오류 발생: {str(e)}")
-            return None
-
-    def _ensure_sso_login(self) -> None:
-        """SSO 로그인 상태를 확인하고 필요한 경우 로그인을 수행합니다."""
-        try:
-            # 캐시된 자격 증명 확인
-            cached_creds = self._get_cached_credentials()
-
-            if cached_creds and 'expiresAt' in cached_creds:
-                # 현재 시간을 UTC로 변환
-                now = datetime.now(pytz.UTC)
-                # 만료 시간을 UTC로 파싱
-                expires_at = datetime.fromisoformat(
-                    cached_creds['expiresAt'].replace('Z', '+00:00')
-                ).astimezone(pytz.UTC)
-
-                if now < expires_at:
-                    logger.debug("Using cached SSO credentials")
-                    return
+                        if expires_at > now:
+                            logger.debug("Using cached SSO credentials")
+                            return
 
-            logger.info(f"AWS SSO 로그인 필요: {self.profile_name}")
+                logger.info(f"AWS SSO 로그인 필요: {self.profile_name}")
 
-            # AWS CLI를 통한 SSO 로그인 실행
-            try:
-                subprocess.run(
-                    ["aws", "sso", "login", "--profile", self.profile_name],
-                    check=True
-                )
-                logger.info(f"AWS SSO 로그인 성공: {self.profile_name}")
-
-            except subprocess.CalledProcessError as e:
-                logger.error(f"AWS SSO 로그인 실패: {str(e)}")
+                # AWS CLI를 통한 SSO 로그인 실행
+                try:
+                    subprocess.run(
+                        ["aws", "sso", "login", "--profile", self.profile_name],
+                        check=True
+                    )
+                    logger.info(f"AWS SSO 로그인 성공: {self.profile_name}")
+
+                except subprocess.CalledProcessError as e:
+                    logger.error(f"AWS SSO 로그인 실패: {str(e)}")
+                    raise
+
+            except Exception as e:
+                logger.error(f"SSO 로그인 처리 중 오류 발생: {str(e)}")
                 raise
 
-        except Exception as e:
-            logger.error(f"SSO 로그인 처리 중 오류 발생: {str(e)}")
-            raise
-
     def get_session(self) -> boto3.Session:
         """
         AWS 세션을 생성하고 반환합니다.
@@ -151,23 +192,106 @@ class AWSSSOLogin:
             raise
 
 
+def _get_sts_client(region: str) -> Any:
+    """리전별 공용 STS 클라이언트 반환 (최초 호출 시 생성)"""
+    client = _sts_clients.get(region)
+    if client is None:
+        with _STS_CLIENT_LOCK:
+            client = _sts_clients.get(region)
+            if client is None:
+                # boto3.Session 생성은 스레드 안전하지 않으므로 잠금 안에서 생성
+                client = boto3.Session(region_name=region).client(
+                    'sts',
+                    config=botocore.config.Config(**CLIENT_CONFIG_OPTIONS)
+                )
+                _sts_clients[region] = client
+    return client
+
+
+def _assume_role_credentials(account_id: str, role_name: str, region: str) -> Dict[str, str]:
+    """STS AssumeRole 호출 후 RefreshableCredentials 메타데이터 형식으로 반환"""
+    sts = _get_sts_client(region)
+    response = sts.assume_role(
+        RoleArn=f"arn:aws:iam::{account_id}:role/{role_name}",
+        RoleSessionName=f"monitor-{account_id}"
+    )
+
+    credentials = response['Credentials']
+    return {
+        'access_key': credentials['AccessKeyId'],
+        'secret_key': credentials['SecretAccessKey'],
+        'token': credentials['SessionToken'],
+        'expiry_time': credentials['Expiration'].isoformat()
+    }
+
+
+@lru_cache(maxsize=None)
+def _build_role_session(account_id: str, role_name: str, region: str) -> boto3.Session:
+    """
+    IAM 역할 기반 세션 생성 (계정/역할/리전별로 프로세스당 1회)
+
+    자격 증명은 만료 시점이 다가오면 botocore가 AssumeRole을 다시 호출하여 자동 갱신합니다.
+    """
+    refresh = partial(_assume_role_credentials, account_id, role_name, region)
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=refresh(),
+        refresh_using=refresh,
+        method='sts-assume-role'
+    )
+
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = credentials
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
+
+
+def _refreshable_metadata(credentials: RefreshableCredentials) -> Dict[str, str]:
+    """
+    botocore 갱신형 자격 증명을 (필요 시 갱신한 뒤) RefreshableCredentials 메타데이터 형식으로 반환
+
+    만료 시각은 자격 증명 조회(지연 갱신 포함) 이후에 읽어야 최신 값이 반영됩니다.
+    """
+    frozen = credentials.get_frozen_credentials()
+    return {
+        'access_key': frozen.access_key,
+        'secret_key': frozen.secret_key,
+        'token': frozen.token,
+        'expiry_time': credentials._expiry_time.isoformat()
+    }
+
+
+async def _refresh_metadata_async(credentials: RefreshableCredentials) -> Dict[str, str]:
+    """aiobotocore 자격 증명 갱신 콜백 (블로킹 STS/SSO 호출은 기본 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _refreshable_metadata, credentials)
+
+
+@lru_cache(maxsize=None)
+def _build_sso_session(account_id: str, region: str) -> boto3.Session:
+    """SSO 기반 세션 생성 (계정/리전별로 프로세스당 1회)"""
+    sso_login = AWSSSOLogin(
+        profile_name=f"AdministratorAccess-{account_id}",
+        region=region
+    )
+    return sso_login.get_session()
+
+
 class AWSSessionManager:
     def __init__(self):
         self.environment = self._detect_environment()
         self._sessions: Dict[str, boto3.Session] = {}
+        self._aio_sessions: Dict[str, AioSession] = {}
+        self._clients: Dict[Tuple[str, str, str], Any] = {}
+        self._async_clients: Dict[Tuple[int, str, str, str], Any] = {}
+        self._async_exit_stack = AsyncExitStack()
+        # 클라이언트 설정은 한 번만 생성하여 모든 클라이언트가 공유
+        self._client_config = botocore.config.Config(**CLIENT_CONFIG_OPTIONS)
+        self._async_client_config = AioConfig(**CLIENT_CONFIG_OPTIONS)
         self._instance_info: Optional[InstanceQueryResult] = None
         self.sso_config = AWSSSOConfig()
 
     def _detect_environment(self) -> EnvironmentType:
-        """실행 환경 감지"""
-        if os.path.exists("/var/run/secrets/kubernetes.io"):
-            return EnvironmentType.EKS
-        try:
-            import requests
-            requests.get("http://169.254.169.254/latest/meta-data/", timeout=1)
-            return EnvironmentType.EC2
-        except:
-            return EnvironmentType.LOCAL
+        """실행 환경 감지 (캐시된 결과 사용)"""
+        return _detect_environment_cached()
 
     async def initialize(self, env: Literal['prd', 'dev'], end_date: Optional[str] = None) -> None:
         """
@@ -198,9 +322,14 @@ class AWSSessionManager:
                         f"across {len(self._instance_info.accounts)} accounts "
                         f"for date {self._instance_info.latest_date}")
 
-            # 각 계정별 세션 초기화
-            for account in self._instance_info.accounts:
-                await self._initialize_session(account)
+            # 각 계정별 세션 동시 초기화 (실패한 계정이 있으면 첫 번째 오류 전파)
+            results = await asyncio.gather(
+                *(self._initialize_session(account) for account in self._instance_info.accounts),
+                return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors:
+                raise errors[0]
 
         except Exception as e:
             logger.error(f"Failed to initialize AWS sessions: {e}")
@@ -210,11 +339,15 @@ class AWSSessionManager:
         """계정별 세션 초기화"""
         try:
             if self.environment == EnvironmentType.LOCAL:
-                session = self._get_sso_session(account.account_id)
+                create_session = self._get_sso_session
             else:
-                session = self._get_role_session(account.account_id)
+                create_session = self._get_role_session
 
-            self._sessions[account.account_id] = session
+            # 세션 생성(STS/SSO 호출)은 블로킹이므로 기본 스레드 풀에서 실행
+            loop = asyncio.get_running_loop()
+            session = await loop.run_in_executor(None, create_session, account.account_id)
+
+            self.set_session(account.account_id, session)
             logger.info(f"Successfully initialized session for account: {account.account_id} "
                         f"(with {account.instance_count} instances)")
 
@@ -223,33 +356,12 @@ class AWSSessionManager:
             raise
 
     def _get_sso_session(self, account_id: str) -> boto3.Session:
-        """SSO 기반 세션 생성"""
-        profile_name = f"AdministratorAccess-{account_id}"
-        sso_login = AWSSSOLogin(
-            profile_name=profile_name,
-            region=self.sso_config.DEFAULT_REGION
-        )
-        return sso_login.get_session()
+        """SSO 기반 세션 반환 (캐시된 세션 재사용)"""
+        return _build_sso_session(account_id, self.sso_config.DEFAULT_REGION)
 
     def _get_role_session(self, account_id: str) -> boto3.Session:
-        """IAM 역할 기반 세션 생성"""
-        role_arn = f"arn:aws:iam::{account_id}:role/{self.sso_config.ROLE_NAME}"
-
-        session = boto3.Session(region_name=self.sso_config.DEFAULT_REGION)
-        sts = session.client('sts')
-
-        response = sts.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName=f"monitor-{account_id}"
-        )
-
-        credentials = response['Credentials']
-        return boto3.Session(
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken'],
-            region_name=self.sso_config.DEFAULT_REGION
-        )
+        """IAM 역할 기반 세션 반환 (캐시된 세션 재사용, 자격 증명은 만료 전 자동 갱신)"""
+        return _build_role_session(account_id, self.sso_config.ROLE_NAME, self.sso_config.DEFAULT_REGION)
 
     def get_session(self, account_id: str) -> Optional[boto3.Session]:
         """특정 계정의 세션 반환"""
@@ -258,26 +370,104 @@ class AWSSessionManager:
             raise ValueError(f"No session found for account: {account_id}")
         return session
 
+    def set_session(self, account_id: str, session: boto3.Session) -> None:
+        """
+        계정 세션 등록
+
+        자격 증명이 교체되므로 해당 계정의 캐시된 클라이언트와 aiobotocore 세션을 함께 폐기합니다.
+        (이미 생성된 비동기 클라이언트는 close_async_clients() 호출 시 종료)
+        """
+        if self._sessions.get(account_id) is session:
+            # 캐시된 동일 세션이 다시 등록된 경우 기존 클라이언트 유지
+            return
+
+        self._sessions[account_id] = session
+        self._aio_sessions.pop(account_id, None)
+        for key in [key for key in self._clients if key[1] == account_id]:
+            del self._clients[key]
+        for key in [key for key in self._async_clients if key[2] == account_id]:
+            del self._async_clients[key]
+
     def get_client(self, service_name: str, account_id: str, region: Optional[str] = None) -> Any:
-        """특정 서비스의 클라이언트 반환"""
-        session = self.get_session(account_id)
+        """
+        특정 서비스의 클라이언트 반환
 
-        # AWS SDK Config 설정
-        config = botocore.config.Config(
-            max_pool_connections=50,  # 연결 풀 크기 증가
-            retries=dict(
-                max_attempts=3  # 재시도 횟수
-            ),
-            connect_timeout=5,  # 연결 타임아웃 (초)
-            read_timeout=60,  # 읽기 타임아웃 (초)
-            tcp_keepalive=True  # TCP 연결 유지
-        )
+        클라이언트는 서비스, 계정, 리전 단위로 캐시되며 set_session()으로
+        계정 세션이 교체되면 폐기됩니다.
+        """
+        region = region or self.sso_config.DEFAULT_REGION
+        key = (service_name, account_id, region)
+
+        client = self._clients.get(key)
+        if client is None:
+            client = self.get_session(account_id).client(
+                service_name,
+                region_name=region,
+                config=self._client_config
+            )
+            self._clients[key] = client
+        return client
 
-        return session.client(
-            service_name,
-            region_name=region or self.sso_config.DEFAULT_REGION,
-            config=config
-        )
+    def _get_aio_session(self, account_id: str) -> AioSession:
+        """
+        계정별 aiobotocore 세션 반환 (boto3 세션의 자격 증명 사용)
+
+        갱신형 자격 증명(AssumeRole/SSO)은 만료 전에 boto3 세션의 자격 증명을 통해
+        다시 갱신되도록 AioRefreshableCredentials로 감싸서 설정합니다.
+        """
+        aio_session = self._aio_sessions.get(account_id)
+        if aio_session is None:
+            credentials = self.get_session(account_id).get_credentials()
+            aio_session = AioSession()
+            if isinstance(credentials, RefreshableCredentials):
+                aio_session._credentials = AioRefreshableCredentials.create_from_metadata(
+                    metadata=_refreshable_metadata(credentials),
+                    refresh_using=partial(_refresh_metadata_async, credentials),
+                    method=credentials.method
+                )
+            else:
+                frozen = credentials.get_frozen_credentials()
+                aio_session.set_credentials(frozen.access_key, frozen.secret_key, frozen.token)
+            self._aio_sessions[account_id] = aio_session
+        return aio_session
+
+    async def get_async_client(self, service_name: str, account_id: str, region: Optional[str] = None) -> Any:
+        """
+        특정 서비스의 비동기(aiobotocore) 클라이언트 반환
+
+        클라이언트는 이벤트 루프, 서비스, 계정, 리전 단위로 캐시되며
+        close_async_clients() 호출 시 함께 종료됩니다.
+        """
+        region = region or self.sso_config.DEFAULT_REGION
+        loop = asyncio.get_running_loop()
+        key = (id(loop), service_name, account_id, region)
+
+        client = self._async_clients.get(key)
+        if client is None:
+            aio_session = self._aio_sessions.get(account_id)
+            if aio_session is None:
+                # 자격 증명 조회(만료 시 STS/SSO 갱신)는 블로킹 호출이므로 기본 스레드 풀에서 실행
+                aio_session = await loop.run_in_executor(None, self._get_aio_session, account_id)
+
+            client = await self._async_exit_stack.enter_async_context(
+                aio_session.create_client(
+                    service_name,
+                    region_name=region,
+                    config=self._async_client_config
+                )
+            )
+            self._async_clients[key] = client
+        return client
+
+    async def close_async_clients(self) -> None:
+        """생성된 비동기 클라이언트 전체 종료"""
+        try:
+            await self._async_exit_stack.aclose()
+        finally:
+            self._async_clients.clear()
+            # 다음 실행 시 갱신된 자격 증명으로 aiobotocore 세션을 다시 생성
+            self._aio_sessions.clear()
+            self._async_exit_stack = AsyncExitStack()
 
     def get_resource(self, service_name: str, account_id: str, region: Optional[str] = None) -> Any:
         """특정 서비스의 리소스 반환"""
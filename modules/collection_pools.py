@@ -0,0 +1,75 @@
+# modules/collection_pools.py
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Literal, Optional, get_args
+
+logger = logging.getLogger(__name__)
+
+# 메트릭 수집 대상 환경
+EnvType = Literal['prd', 'dev']
+
+# 환경별 메트릭 수집 전용 프로세스 풀
+_process_pools: Dict[str, ProcessPoolExecutor] = {}
+
+# 슬로우 쿼리 분석용 프로세스 풀
+_analysis_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool(env: EnvType) -> ProcessPoolExecutor:
+    """환경별 수집 프로세스 풀 반환 (기동 시 생성되지 않은 경우 최초 요청 시 생성)"""
+    pool = _process_pools.get(env)
+    if pool is None:
+        # 부모 프로세스의 이벤트 루프/MongoDB 연결을 물려받지 않도록 spawn 사용
+        pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        _process_pools[env] = pool
+    return pool
+
+
+def replace_broken_process_pool(env: EnvType) -> None:
+    """워커 프로세스가 비정상 종료되어 사용할 수 없게 된 풀을 폐기하고 새로 생성"""
+    pool = _process_pools.pop(env, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+    get_process_pool(env)
+    logger.warning(f"메트릭 수집 프로세스 풀 재생성: {env}")
+
+
+def start_process_pools() -> None:
+    """애플리케이션 기동 시 환경별 수집 프로세스 풀 생성"""
+    for env in get_args(EnvType):
+        get_process_pool(env)
+
+
+def shutdown_process_pools() -> None:
+    """애플리케이션 종료 시 환경별 수집 프로세스 풀 종료"""
+    for env, pool in _process_pools.items():
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"메트릭 수집 프로세스 풀 종료: {env}")
+    _process_pools.clear()
+
+
+def get_analysis_pool() -> ProcessPoolExecutor:
+    """슬로우 쿼리 분석용 프로세스 풀 반환 (최초 호출 시 생성)"""
+    global _analysis_pool
+    if _analysis_pool is None:
+        # 부모 프로세스의 이벤트 루프/클라이언트를 물려받지 않도록 spawn 사용
+        _analysis_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _analysis_pool
+
+
+def shutdown_analysis_pool() -> None:
+    """슬로우 쿼리 분석용 프로세스 풀 종료 (생성된 경우에만)"""
+    global _analysis_pool
+    if _analysis_pool is not None:
+        _analysis_pool.shutdown(wait=False, cancel_futures=True)
+        _analysis_pool = None
+        logger.info("슬로우 쿼리 분석 프로세스 풀 종료")
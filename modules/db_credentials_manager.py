@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any, NamedTuple
 import logging
 import asyncio
 import getpass
+import time
 from datetime import datetime
 from modules.mongodb_connector import MongoDBConnector
 from modules.mysql_connector import MySQLConnector, MySQLConnectionInfo
@@ -10,6 +11,9 @@ from bson.objectid import ObjectId
 
 logger = logging.getLogger(__name__)
 
+# 접속 정보 캐시 유지 시간 (초), 경과 후 전체 재조회
+CREDENTIAL_CACHE_TTL = 300
+
 
 class DBCredential(NamedTuple):
     """DB 접속 정보"""
@@ -24,11 +28,17 @@ class DBCredential(NamedTuple):
     use_yn: str
 
 
+# 접속 정보 조회 시 필요한 필드만 가져오도록 하는 projection
+_CREDENTIAL_PROJECTION = {"_id": 0, **{field: 1 for field in DBCredential._fields}}
+
+
 class DBCredentialsManager:
     def __init__(self):
         self.collection_name = mongo_settings.MONGO_DB_CREDENTIALS_COLLECTION
         self._collection = None
         self._cached_credentials = {}
+        self._cache_loaded_at: Optional[float] = None
+        self._cache_lock = asyncio.Lock()
         self._mysql_connections = {}
 
     async def _get_collection(self):
@@ -39,6 +49,37 @@ class DBCredentialsManager:
             )
         return self._collection
 
+    def _is_cache_expired(self) -> bool:
+        """접속 정보 캐시 만료 여부"""
+        return (
+            self._cache_loaded_at is None
+            or time.monotonic() - self._cache_loaded_at > CREDENTIAL_CACHE_TTL
+        )
+
+    async def _warm_cache(self):
+        """사용 중인 모든 접속 정보를 한 번에 조회하여 캐시 갱신"""
+        async with self._cache_lock:
+            # 대기 중 다른 작업이 이미 갱신한 경우 재조회하지 않음
+            if not self._is_cache_expired():
+                return
+
+            collection = await self._get_collection()
+            cursor = collection.find({"use_yn": "Y"}, projection=_CREDENTIAL_PROJECTION)
+            credentials = {}
+            async for doc in cursor:
+                # 필드가 누락된 문서는 해당 인스턴스만 제외 (전체 갱신은 계속 진행)
+                try:
+                    credentials[doc['instance_id']] = DBCredential(**doc)
+                except (KeyError, TypeError) as e:
+                    logger.warning(
+                        f"접속 정보 형식 오류로 캐시에서 제외 "
+                        f"(인스턴스: {doc.get('instance_id')}): {str(e)}"
+                    )
+
+            self._cached_credentials = credentials
+            self._cache_loaded_at = time.monotonic()
+            logger.debug(f"접속 정보 캐시 갱신: {len(self._cached_credentials)}건")
+
     async def get_credential(
             self,
             instance_id: str,
@@ -59,33 +100,28 @@ class DBCredentialsManager:
             Optional[DBCredential]: DB 접속 정보
         """
         try:
+            # 캐시가 비었거나 만료된 경우 전체 접속 정보를 한 번에 조회
+            if self._is_cache_expired():
+                await self._warm_cache()
+
             # 캐시 확인
             if instance_id in self._cached_credentials:
                 credential = self._cached_credentials[instance_id]
                 await self._ensure_mysql_connection(credential, use_secondary)
                 return credential
 
-            # DB에서 조회
+            # 캐시 갱신 이후 추가된 접속 정보는 개별 조회
             collection = await self._get_collection()
             credential_doc = await collection.find_one(
                 {
                     "instance_id": instance_id,
                     "use_yn": "Y"
-                }
+                },
+                projection=_CREDENTIAL_PROJECTION
             )
 
             if credential_doc:
-                credential = DBCredential(
-                    instance_id=credential_doc['instance_id'],
-                    env=credential_doc['env'],
-                    default_db=credential_doc['default_db'],
-                    primary_endpoint=credential_doc['primary_endpoint'],
-                    secondary_endpoint=credential_doc['secondary_endpoint'],
-                    port=credential_doc['port'],
-                    master_user=credential_doc['master_user'],
-                    password=credential_doc['password'],
-                    use_yn=credential_doc['use_yn']
-                )
+                credential = DBCredential(**credential_doc)
 
                 self._cached_credentials[instance_id] = credential
                 await self._ensure_mysql_connection(credential, use_secondary)
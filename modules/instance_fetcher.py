@@ -5,8 +5,9 @@ import logging
 import pytz
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from modules.mongodb_connector import MongoDBConnector
-from pydantic import BaseModel, Field
-from collections import defaultdict
+from pydantic import BaseModel, ConfigDict, Field
+from itertools import groupby
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +17,15 @@ class InstanceInfo(BaseModel):
    region: str = Field(..., alias='Region')
    instance_identifier: str = Field(..., alias='DBInstanceIdentifier')
    tags: Dict[str, str] = Field(..., alias='Tags')
+   engine: Optional[str] = Field(None, alias='Engine')
    timestamp: str
 
-   class Config:
-       populate_by_name = True
-       arbitrary_types_allowed = True
+   model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+
+   @property
+   def is_aurora(self) -> bool:
+       """Aurora 엔진 여부"""
+       return bool(self.engine) and self.engine.startswith('aurora')
 
 class AccountInfo(BaseModel):
    """계정 정보를 위한 Pydantic 모델"""
@@ -35,8 +40,7 @@ class InstanceQueryResult(BaseModel):
    latest_date: Optional[str] = None
    env: str  # env 필드 추가
 
-   class Config:
-       populate_by_name = True
+   model_config = ConfigDict(populate_by_name=True)
 
 class InstanceFetcher:
    """데이터베이스에서 RDS 인스턴스 정보를 조회하는 클래스"""
@@ -49,8 +53,13 @@ class InstanceFetcher:
        """데이터베이스 연결을 가져옵니다."""
        return await MongoDBConnector.get_database()
 
-   async def get_latest_date_pipeline(self, start_date: str, end_date: str) -> List[Dict]:
-       """주어진 기간 내의 최신 날짜를 찾는 파이프라인을 반환합니다."""
+   async def get_latest_instances_pipeline(self, start_date: str, end_date: str, env: str) -> List[Dict]:
+       """
+       주어진 기간 내 최신 날짜를 찾고, 해당 날짜의 환경별 인스턴스를 함께 조회하는 파이프라인을 반환합니다.
+
+       결과는 인스턴스별 도큐먼트({date, instances, timestamp})이며, 최신 날짜에 해당 환경의
+       인스턴스가 없으면 instances 필드 없이 date만 담긴 도큐먼트 1건이 반환됩니다.
+       """
        return [
            {
                "$addFields": {
@@ -66,62 +75,66 @@ class InstanceFetcher:
                }
            },
            {
-               "$sort": {"date": -1, "timestamp": -1}
-           },
-           {
-               "$group": {
-                   "_id": "$date",
-                   "docs": {"$first": "$$ROOT"}
-               }
+               "$group": {"_id": "$date"}
            },
            {
                "$sort": {"_id": -1}
            },
-           {"$limit": 1}
-       ]
-
-   async def get_instances_pipeline(self, latest_date: str, env: str) -> List[Dict]:
-       """특정 날짜와 환경에 대한 인스턴스 조회 파이프라인을 반환합니다."""
-       return [
+           {"$limit": 1},
            {
-               "$addFields": {
-                   "date": {"$substr": ["$timestamp", 0, 10]}
+               # 최신 날짜의 인스턴스를 같은 요청에서 조회
+               "$lookup": {
+                   "from": self.collection_name,
+                   "let": {"latest_date": "$_id"},
+                   "pipeline": [
+                       {
+                           "$match": {
+                               "$expr": {
+                                   "$eq": [{"$substr": ["$timestamp", 0, 10]}, "$$latest_date"]
+                               }
+                           }
+                       },
+                       {"$unwind": "$instances"},
+                       {
+                           "$match": {
+                               "$or": [
+                                   {"instances.Tags.env": env},
+                                   {"instances.Tags.Environment": env}
+                               ]
+                           }
+                       },
+                       {"$project": {"_id": 0, "instances": 1, "timestamp": 1}}
+                   ],
+                   "as": "matched"
                }
            },
+           # $lookup 직후 $unwind는 서버에서 병합 처리되어 16MB 도큐먼트 제한을 받지 않음
+           {"$unwind": {"path": "$matched", "preserveNullAndEmptyArrays": True}},
            {
-               "$match": {"date": latest_date}
-           },
-           {"$unwind": "$instances"},
-           {
-               "$match": {
-                   "$or": [
-                       {"instances.Tags.env": env},
-                       {"instances.Tags.Environment": env}
-                   ]
+               "$project": {
+                   "_id": 0,
+                   "date": "$_id",
+                   "instances": "$matched.instances",
+                   "timestamp": "$matched.timestamp"
                }
            }
        ]
 
    def _group_instances_by_account(self, instances: List[InstanceInfo]) -> List[AccountInfo]:
        """인스턴스를 계정별로 그룹화합니다."""
-       account_instances = defaultdict(list)
+       # 계정 ID, 인스턴스 식별자 순으로 한 번 정렬한 뒤 연속 구간으로 그룹화
+       instances.sort(key=attrgetter('account_id', 'instance_identifier'))
 
-       # 인스턴스를 계정별로 분류
-       for instance in instances:
-           account_instances[instance.account_id].append(instance)
-
-       # AccountInfo 객체 생성
        accounts = []
-       for account_id, instances in account_instances.items():
-           account_info = AccountInfo(
+       for account_id, group in groupby(instances, key=attrgetter('account_id')):
+           account_instances = list(group)
+           accounts.append(AccountInfo(
                account_id=account_id,
-               instances=sorted(instances, key=lambda x: x.instance_identifier),
-               instance_count=len(instances)
-           )
-           accounts.append(account_info)
+               instances=account_instances,
+               instance_count=len(account_instances)
+           ))
 
-       # 계정 ID로 정렬하여 반환
-       return sorted(accounts, key=lambda x: x.account_id)
+       return accounts
 
    async def get_instance_identifiers(
            self,
@@ -146,31 +159,32 @@ class InstanceFetcher:
            db = await self._get_database()
            collection = db[self.collection_name]
 
-           # 최신 날짜 찾기
-           latest_doc = None
-           async for doc in collection.aggregate(await self.get_latest_date_pipeline(start_date, end_date)):
-               latest_doc = doc['docs']
-               break
+           # 최신 날짜와 해당 날짜의 인스턴스 정보를 한 번의 집계로 조회
+           docs = await collection.aggregate(
+               await self.get_latest_instances_pipeline(start_date, end_date, env)
+           ).to_list(length=None)
 
-           if not latest_doc:
+           if not docs:
                logger.warning(f"No documents found between {start_date} and {end_date}")
                return InstanceQueryResult(accounts=[], total_instances=0, env=env)  # env 추가
 
-           latest_date = latest_doc['date']
+           latest_date = docs[0]['date']
            logger.info(f"Found latest date: {latest_date}")
 
-           # 인스턴스 정보 조회
-           instances_list = []
-           async for doc in collection.aggregate(await self.get_instances_pipeline(latest_date, env)):
-               instance = doc['instances']
-               instance_info = InstanceInfo(
-                   AccountId=instance['AccountId'],
-                   Region=instance['Region'],
-                   DBInstanceIdentifier=instance['DBInstanceIdentifier'],
-                   Tags=instance['Tags'],
+           # 인스턴스 정보 변환 (해당 환경 인스턴스가 없으면 instances 필드가 없음)
+           # 수집기가 저장한 형식이 고정되어 있으므로 검증 없이 모델 생성
+           instances_list = [
+               InstanceInfo.model_construct(
+                   account_id=doc['instances']['AccountId'],
+                   region=doc['instances']['Region'],
+                   instance_identifier=doc['instances']['DBInstanceIdentifier'],
+                   tags=doc['instances']['Tags'],
+                   engine=doc['instances'].get('Engine'),
                    timestamp=doc['timestamp']
                )
-               instances_list.append(instance_info)
+               for doc in docs
+               if 'instances' in doc
+           ]
 
            # 계정별로 그룹화
            grouped_accounts = self._group_instances_by_account(instances_list)
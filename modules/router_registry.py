@@ -0,0 +1,91 @@
+# modules/router_registry.py
+
+import importlib
+import logging
+import pkgutil
+from pathlib import Path
+from typing import List, Tuple
+from fastapi import FastAPI, APIRouter
+
+logger = logging.getLogger(__name__)
+
+# (모듈 경로, 라우터 속성명, 등록 prefix, 기본 태그)
+RouterEntry = Tuple[str, str, str, str]
+
+# API 모듈이 라우터를 노출하는 속성명
+ROUTER_ATTR = "router"
+
+
+def discover_routers(apis_path: Path, package: str = "apis") -> List[RouterEntry]:
+    """
+    apis 패키지 하위 모듈을 임포트하여 등록할 라우터 목록 생성
+
+    Args:
+        apis_path: APIs 패키지 디렉토리 경로
+        package: APIs 패키지 이름
+
+    Returns:
+        List[RouterEntry]: 라우터 등록 정보 목록
+    """
+    entries: List[RouterEntry] = []
+
+    # apis 패키지 하위의 모든 모듈 검색 (모듈 경로를 바로 얻음)
+    for _, module_path, is_pkg in pkgutil.walk_packages([str(apis_path)], prefix=f"{package}."):
+        module_parts = module_path.split(".")
+        module_name = module_parts[-1]
+        if is_pkg or module_name.startswith("_"):
+            continue
+
+        try:
+            # 모듈 동적 로드
+            module = importlib.import_module(module_path)
+
+            # 모듈의 라우터는 `router` 속성으로 노출하는 것을 규칙으로 함
+            router = getattr(module, ROUTER_ATTR, None)
+            if not isinstance(router, APIRouter):
+                continue
+
+            # 모듈 경로에서 버전 정보 추출 (v1, v2 등)
+            version = module_parts[1] if len(module_parts) > 2 else ""
+
+            # 라우터 자체 prefix를 포함한 등록 prefix 설정
+            if version:
+                prefix = f"/api/{version}{router.prefix}"
+            else:
+                prefix = f"/api{router.prefix}"
+
+            entries.append((module_path, ROUTER_ATTR, prefix, module_name))
+
+        except Exception as e:
+            logger.error(f"라우터 로드 중 오류 발생 ({module_path}): {str(e)}")
+            logger.exception(e)
+
+    return entries
+
+
+def register_routers(app: FastAPI, entries: List[RouterEntry]) -> None:
+    """
+    라우터 등록 정보 목록에 따라 애플리케이션에 라우터 등록
+
+    Args:
+        app: FastAPI 애플리케이션 인스턴스
+        entries: 라우터 등록 정보 목록
+    """
+    for module_path, attr_name, prefix, tag in entries:
+        try:
+            router = getattr(importlib.import_module(module_path), attr_name)
+
+            # 라우터의 태그 설정
+            if not router.tags:
+                router.tags = [tag]
+
+            # 기존 prefix 제거 (등록 prefix에 이미 포함됨)
+            router.prefix = ""
+
+            # 라우터 등록
+            app.include_router(router, prefix=prefix)
+            logger.info(f"라우터 등록 완료: {tag} ({prefix})")
+
+        except Exception as e:
+            logger.error(f"라우터 로드 중 오류 발생 ({module_path}): {str(e)}")
+            logger.exception(e)
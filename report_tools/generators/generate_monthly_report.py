@@ -1,8 +1,8 @@
 # scripts/generate_monthly_report.py
 import asyncio
 import os
-import json
 import logging
+import orjson
 from calendar import monthrange
 from datetime import date, datetime
 from zoneinfo import ZoneInfo
@@ -104,8 +104,8 @@ async def generate_monthly_report(year: int = None, month: int = None) -> dict:
 
         # JSON 파일로 저장
         json_file = generator.get_report_path("statistics.json")
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        with open(json_file, "wb") as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         print(f"\n3. 통계 데이터 저장 완료: {json_file}")
 
@@ -1,6 +1,6 @@
 # report_tools/instance_statistics.py
 from typing import List, Dict, Any, Optional, Set
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase
 import logging
 from modules.mongodb_connector import MongoDBConnector
@@ -8,6 +8,7 @@ from configs.mongo_conf import mongo_settings
 from report_tools.base import ReportBaseTool
 
 logger = logging.getLogger(__name__)
+KST = timezone(timedelta(hours=9))
 
 
 class InstanceStatisticsTool(ReportBaseTool):
@@ -292,11 +293,22 @@ class InstanceStatisticsTool(ReportBaseTool):
         return [
             {
                 "id": r["_id"],
-                "created_at": r["InstanceCreateTime"].split(" ")[0]  # 날짜만 추출
+                "created_at": self._format_create_date(r["InstanceCreateTime"])
             }
             for r in result
         ]
 
+    @staticmethod
+    def _format_create_date(create_time: Any) -> Optional[str]:
+        """인스턴스 생성 시각에서 KST 기준 날짜(YYYY-MM-DD)만 추출"""
+        if create_time is None:
+            return None
+        if isinstance(create_time, datetime):
+            # BSON Date는 UTC 기준 naive datetime으로 반환됨
+            return create_time.replace(tzinfo=timezone.utc).astimezone(KST).strftime('%Y-%m-%d')
+        # 이전 수집분은 "YYYY-MM-DD HH:MM:SS KST" 문자열로 저장됨
+        return create_time.split(" ")[0]
+
     async def _get_instance_deletion_dates(self, collection, instance_ids: List[str], last_date: str) -> List[
         Dict[str, Any]]:
         """제거된 인스턴스의 삭제일자 조회"""
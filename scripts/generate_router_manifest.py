@@ -0,0 +1,44 @@
+# scripts/generate_router_manifest.py
+"""
+API 라우터 매니페스트 생성 스크립트
+
+apis 패키지를 한 번 탐색하여 apis/_manifest.py 에 라우터 등록 정보를 기록합니다.
+매니페스트가 있으면 애플리케이션 기동 시 디렉토리 탐색 없이 해당 목록으로 라우터를 등록합니다.
+API 모듈을 추가/삭제한 경우 배포 전에 다시 실행해야 합니다.
+
+사용법:
+    python scripts/generate_router_manifest.py
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from modules.router_registry import discover_routers
+
+MANIFEST_TEMPLATE = '''# apis/_manifest.py
+# scripts/generate_router_manifest.py 로 생성된 파일 (직접 수정하지 마세요)
+
+# (모듈 경로, 라우터 속성명, 등록 prefix, 기본 태그)
+ROUTERS = [
+{entries}]
+'''
+
+
+def main() -> None:
+    apis_path = project_root / "apis"
+    entries = discover_routers(apis_path, "apis")
+
+    manifest_path = apis_path / "_manifest.py"
+    manifest_path.write_text(
+        MANIFEST_TEMPLATE.format(entries="".join(f"    {entry!r},\n" for entry in entries)),
+        encoding="utf-8"
+    )
+    print(f"라우터 {len(entries)}개를 매니페스트에 기록했습니다: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()